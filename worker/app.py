@@ -23,10 +23,17 @@ from worker.models import (
     JobStatus,
     JobStatusResponse,
     OutputFormat,
+    PIPELINE_STAGES,
+    Stage,
     StageProgress,
 )
-from worker.utils.cleanup import cleanup_job_dir, periodic_cleanup, remove_job_dir
-from worker.utils.gpu import get_gpu_memory_info
+from worker.utils.cleanup import (
+    cleanup_job_dir,
+    periodic_cleanup,
+    remove_job_dir,
+    schedule_expiry,
+)
+from worker.utils.gpu import get_gpu_memory_info, gpu_job_slots, limit_gpu_memory
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,17 +52,57 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory job store
+# In-memory job store (the working copy; mirrored to Redis when enabled)
 jobs: dict[str, dict] = {}
 
-# GPU lock: one job at a time on a single GPU
-gpu_lock = asyncio.Lock()
+# Durable/shared job store, set at startup when SPLAT_REDIS_URL is configured
+job_store = None
+
+# Direct-upload pipeline handoff queues. Each holds job IDs for one segment of
+# the pipeline and is drained FIFO by a single _stage_worker, so CPU segments
+# (frames, cleanup+conversion) of one job overlap the GPU segment of another.
+frame_queue: asyncio.Queue[str] = asyncio.Queue()
+gpu_queue: asyncio.Queue[str] = asyncio.Queue()
+convert_queue: asyncio.Queue[str] = asyncio.Queue()
+
+# GPU slots: how many jobs may run pose estimation + training at once
+# (int(1 / max_gpu_memory_fraction), i.e. 1 by default). Held only around the
+# GPU stages; the queue client pauses claims while every slot is taken.
+gpu_sem = asyncio.Semaphore(gpu_job_slots())
+
+# Redis-claimed jobs held by this process (queued locally or running). The
+# claimer only takes a job while there's room for it (one per GPU slot, plus
+# one extracting frames), so a replica never drains the whole shared queue,
+# and the held jobs are heartbeated so the reclaimer leaves them alone.
+redis_inflight: set[str] = set()
+redis_claim_slots = asyncio.Semaphore(gpu_job_slots() + 1)
+
+# Read size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 
 @app.on_event("startup")
 async def startup():
+    global job_store
     settings.jobs_dir.mkdir(parents=True, exist_ok=True)
     asyncio.create_task(periodic_cleanup(jobs))
+    asyncio.create_task(_stage_worker(frame_queue, _frame_stage, gpu_queue))
+    # One GPU-stage consumer per slot, so small jobs can share the GPU
+    limit_gpu_memory()
+    for _ in range(gpu_job_slots()):
+        asyncio.create_task(_stage_worker(gpu_queue, _gpu_stage, convert_queue))
+    asyncio.create_task(_stage_worker(convert_queue, _convert_stage))
+
+    # If Redis is configured, jobs are persisted there and fed to the pipeline
+    # from its queue (so queued/crashed jobs survive restarts)
+    if settings.redis_url:
+        from worker.store_redis import RedisJobStore
+
+        job_store = RedisJobStore()
+        asyncio.create_task(_redis_claimer())
+        asyncio.create_task(_redis_heartbeat())
+        asyncio.create_task(job_store.reclaim_stale())
+        logger.info("Redis job store enabled: %s", settings.redis_url)
     logger.info("Server started. Jobs dir: %s", settings.jobs_dir.resolve())
 
     # If queue URL is configured, start polling for remote jobs
@@ -63,8 +110,8 @@ async def startup():
         from worker.queue_client import QueueClient
 
         queue_client = QueueClient()
-        # Pass the GPU lock so the client pauses claims while a job is processing.
-        asyncio.create_task(queue_client.run(process_remote_job, gpu_lock))
+        # Pass the GPU semaphore so the client pauses claims while the GPU is full.
+        asyncio.create_task(queue_client.run(process_remote_job, gpu_sem))
         logger.info("Queue polling enabled: %s", settings.queue_url)
 
 
@@ -108,22 +155,29 @@ async def create_job(
     # Clamp to nearest multiple of 64 for GPU efficiency
     resolution = max(256, min(1920, (resolution // 64) * 64))
 
-    # Check file size
-    content = await video.read()
-    size_mb = len(content) / (1024 * 1024)
-    if size_mb > settings.max_upload_size_mb:
-        raise HTTPException(413, f"File too large: {size_mb:.0f}MB (max {settings.max_upload_size_mb}MB)")
-
     # Create job
     job_id = uuid.uuid4().hex[:12]
     job_dir = settings.jobs_dir / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save video
+    # Stream the upload to disk in 1MB chunks instead of buffering the whole
+    # file (up to max_upload_size_mb) in RAM; abort as soon as it's too large.
     video_ext = Path(video.filename).suffix if video.filename else ".mp4"
     video_path = job_dir / f"input{video_ext}"
+    max_bytes = settings.max_upload_size_mb * 1024 * 1024
+    written = 0
     with open(video_path, "wb") as f:
-        f.write(content)
+        while chunk := await video.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_bytes:
+                break
+            await asyncio.to_thread(f.write, chunk)
+    if written > max_bytes:
+        await asyncio.to_thread(remove_job_dir, job_dir)
+        raise HTTPException(
+            413, f"File too large: >{settings.max_upload_size_mb}MB (max {settings.max_upload_size_mb}MB)"
+        )
+    size_mb = written / (1024 * 1024)
 
     config = JobConfig(
         output_format=output_format,
@@ -133,26 +187,27 @@ async def create_job(
     )
 
     now = datetime.now(timezone.utc)
-    jobs[job_id] = {
+    job = {
         "status": JobStatus.QUEUED,
         "created_at": now,
         "created_at_ts": time.time(),
         "config": config,
         "video_path": str(video_path),
         "job_dir": str(job_dir),
-        "stages": [
-            {"name": "frame_extraction", "status": "pending"},
-            {"name": "pose_estimation", "status": "pending"},
-            {"name": "training", "status": "pending"},
-            {"name": "cleanup", "status": "pending"},
-            {"name": "conversion", "status": "pending"},
-        ],
+        "stages": {name: Stage(name) for name in PIPELINE_STAGES},
         "error": None,
         "result_path": None,
     }
 
-    # Launch processing in background
-    asyncio.create_task(process_job(job_id))
+    # Hand off to the pipeline (each segment processes in submission order).
+    # With Redis, the record lives there until some replica claims it; no
+    # local copy is kept, since any replica may be the one that runs it.
+    if job_store is not None:
+        await job_store.enqueue(job_id, job)
+    else:
+        jobs[job_id] = job
+        schedule_expiry(job_id, job["created_at_ts"])
+        await frame_queue.put(job_id)
     logger.info("Job %s created (%.1f MB, %s)", job_id, size_mb, config)
 
     return JobResponse(
@@ -164,15 +219,15 @@ async def create_job(
 
 @app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
-    if job_id not in jobs:
-        raise HTTPException(404, "Job not found")
-
-    job = jobs[job_id]
+    job = await _get_job(job_id)
     return JobStatusResponse(
         job_id=job_id,
         status=job["status"],
         created_at=job["created_at"],
-        stages=[StageProgress(**s) for s in job["stages"]],
+        stages=[
+            StageProgress(name=s.name, status=s.status, detail=s.detail)
+            for s in job["stages"].values()
+        ],
         error=job.get("error"),
         result_format=job["config"].output_format if job["status"] == JobStatus.COMPLETED else None,
     )
@@ -180,15 +235,16 @@ async def get_job_status(job_id: str):
 
 @app.get("/api/v1/jobs/{job_id}/result")
 async def get_job_result(job_id: str):
-    if job_id not in jobs:
-        raise HTTPException(404, "Job not found")
-
-    job = jobs[job_id]
+    job = await _get_job(job_id)
     if job["status"] != JobStatus.COMPLETED:
         raise HTTPException(400, f"Job not completed (status: {job['status'].value})")
 
     result_path = Path(job["result_path"])
-    if not result_path.exists():
+    # One stat, handed to FileResponse (sets Content-Length without re-statting;
+    # the body is sent with sendfile where available)
+    try:
+        stat_result = result_path.stat()
+    except FileNotFoundError:
         raise HTTPException(404, "Result file not found")
 
     media_type = (
@@ -200,6 +256,9 @@ async def get_job_result(job_id: str):
         path=str(result_path),
         filename=result_path.name,
         media_type=media_type,
+        stat_result=stat_result,
+        # Starlette versions that serve Range requests advertise
+        # Accept-Ranges themselves; older ones must not claim it
         headers={"Content-Disposition": f'attachment; filename="{result_path.name}"'},
     )
 
@@ -209,9 +268,8 @@ async def get_job_dataset(job_id: str):
     """Download the COLMAP dataset (images + sparse model) for debugging —
     bisect COLMAP vs training by loading it into another trainer. Only present
     when the COLMAP backend ran (not DUSt3R) and colmap_save_dataset is on."""
-    if job_id not in jobs:
-        raise HTTPException(404, "Job not found")
-    zip_path = Path(jobs[job_id]["job_dir"]) / "colmap_dataset.zip"
+    job = await _get_job(job_id)
+    zip_path = Path(job["job_dir"]) / "colmap_dataset.zip"
     if not zip_path.exists():
         raise HTTPException(
             404, "No COLMAP dataset (DUSt3R fallback ran, or job not finished)"
@@ -227,11 +285,10 @@ async def get_job_dataset(job_id: str):
 @app.get("/api/v1/jobs/{job_id}/preview")
 async def get_job_preview(job_id: str, format: str = "webp"):
     """Serve the rendered scene preview. format=webp (default) or png."""
-    if job_id not in jobs:
-        raise HTTPException(404, "Job not found")
+    job = await _get_job(job_id)
 
     ext = "png" if format == "png" else "webp"
-    preview_path = Path(jobs[job_id]["job_dir"]) / f"preview.{ext}"
+    preview_path = Path(job["job_dir"]) / f"preview.{ext}"
     if not preview_path.exists():
         raise HTTPException(404, "Preview not available")
 
@@ -241,128 +298,261 @@ async def get_job_preview(job_id: str, format: str = "webp"):
 
 @app.delete("/api/v1/jobs/{job_id}")
 async def delete_job(job_id: str):
-    if job_id not in jobs:
-        raise HTTPException(404, "Job not found")
-
-    job = jobs.pop(job_id)
-    remove_job_dir(Path(job["job_dir"]))
+    job = await _get_job(job_id)
+    jobs.pop(job_id, None)
+    if job_store is not None:
+        await job_store.delete(job_id)
+    await asyncio.to_thread(remove_job_dir, Path(job["job_dir"]))
     return {"message": "Job deleted", "job_id": job_id}
 
 
+async def _get_job(job_id: str) -> dict:
+    """Look up a job; 404 if it doesn't exist. With Redis, the local copy is
+    only authoritative while this process is running the job (it's ahead of
+    the stored record mid-stage); otherwise another replica may have updated
+    it since, so the shared store is read."""
+    if job_store is not None and job_id not in redis_inflight:
+        job = await job_store.load(job_id)
+    else:
+        job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(404, "Job not found")
+    return job
+
+
 # --- Pipeline orchestration ---
 
 
 def _update_stage(job_id: str, stage_name: str, status: str, detail: str | None = None):
     """Update a pipeline stage's status."""
+    job = jobs.get(job_id)
+    if job is None:
+        return
+    stage = job["stages"][stage_name]
+    stage.status = status
+    if detail:
+        stage.detail = detail
+
+
+def _fail_job(job_id: str, job: dict, exc: Exception):
+    """Mark a job and its unfinished stages as failed."""
+    logger.error("Job %s failed", job_id, exc_info=exc)
+    job["status"] = JobStatus.FAILED
+    job["error"] = str(exc)
+    for stage in job["stages"].values():
+        if stage.status in ("pending", "running"):
+            stage.status = "failed"
+
+
+async def _stage_worker(queue: asyncio.Queue, run_stage, next_queue: asyncio.Queue | None = None):
+    """Drain queue forever: run one pipeline segment per job, then hand the job
+    ID to next_queue. One worker per segment, so segments of different jobs
+    overlap (e.g. job N+1's frame extraction runs during job N's training)."""
+    while True:
+        job_id = await queue.get()
+        try:
+            job = jobs.get(job_id)
+            # Deleted or already failed while waiting in the queue
+            if job is None or job["status"] == JobStatus.FAILED:
+                _release_claim(job_id)
+                continue
+            try:
+                await run_stage(job_id, job)
+            except Exception as e:
+                _fail_job(job_id, job, e)
+                await _persist_job(job_id, job, finished=True)
+                _release_claim(job_id)
+                continue
+            await _persist_job(job_id, job, finished=next_queue is None)
+            if next_queue is not None:
+                await next_queue.put(job_id)
+            else:
+                _release_claim(job_id)
+        finally:
+            queue.task_done()
+
+
+def _release_claim(job_id: str):
+    """A job left the pipeline: free its Redis claim slot (if it holds one)."""
+    if job_id in redis_inflight:
+        redis_inflight.discard(job_id)
+        redis_claim_slots.release()
+
+
+async def _persist_job(job_id: str, job: dict, finished: bool = False):
+    """Mirror a job to the Redis store (no-op without one). finished=True also
+    releases its claim. Failures are logged: the in-memory copy stays valid."""
+    if job_store is None:
+        return
     if job_id not in jobs:
+        # Deleted mid-stage: saving would resurrect the removed record
         return
-    for stage in jobs[job_id]["stages"]:
-        if stage["name"] == stage_name:
-            stage["status"] = status
-            if detail:
-                stage["detail"] = detail
-            break
+    try:
+        await job_store.save(job_id, job)
+        if finished:
+            await job_store.ack(job_id)
+    except Exception:
+        logger.warning("Failed to persist job %s to Redis", job_id, exc_info=True)
+
+
+async def _redis_claimer():
+    """Feed the pipeline from the Redis queue: claim a job, load its record
+    (possibly written by another replica or a previous run), hand it on.
+    Claims only while this process has a free slot (see redis_claim_slots)."""
+    while True:
+        await redis_claim_slots.acquire()
+        try:
+            job_id = await job_store.claim()
+            if job_id in redis_inflight:
+                # Requeued while still held here (e.g. a missed heartbeat): the
+                # running copy finishes it; don't reset it or run it twice.
+                logger.warning("Ignoring re-claim of in-flight job %s", job_id)
+                redis_claim_slots.release()
+                continue
+            job = await job_store.load(job_id)
+            if job is None:
+                # Expired or deleted while queued
+                await job_store.ack(job_id)
+                redis_claim_slots.release()
+                continue
+            if job["status"] != JobStatus.QUEUED:
+                # Reclaimed after a crash mid-pipeline: restart from scratch
+                logger.info("Restarting reclaimed job %s", job_id)
+                job["status"] = JobStatus.QUEUED
+                job["error"] = None
+                for stage in job["stages"].values():
+                    stage.status = "pending"
+                    stage.detail = None
+            jobs[job_id] = job
+            schedule_expiry(job_id, job["created_at_ts"])
+            redis_inflight.add(job_id)
+            await frame_queue.put(job_id)
+        except Exception:
+            logger.exception("Redis claim error")
+            redis_claim_slots.release()
+            await asyncio.sleep(1)
+
+
+async def _redis_heartbeat():
+    """Refresh the update time of every job held here, so the reclaimer never
+    requeues one that is only waiting in a local queue or a long stage."""
+    while True:
+        await asyncio.sleep(settings.redis_reclaim_interval_s)
+        for job_id in list(redis_inflight):
+            try:
+                await job_store.touch(job_id)
+            except Exception:
+                logger.warning("Failed to heartbeat job %s", job_id, exc_info=True)
+
+
+async def _frame_stage(job_id: str, job: dict):
+    """Stage 1 (CPU/ffmpeg): frame extraction. all_frames = full evenly-spaced
+    set (for COLMAP); sharp_frames = blur-filtered subset (for training)."""
+    job["status"] = JobStatus.PROCESSING
+    config: JobConfig = job["config"]
+
+    _update_stage(job_id, "frame_extraction", "running")
+    video_path = Path(job["video_path"])
+    await _probe_video(video_path)
+    all_frames, sharp_frames = await asyncio.to_thread(
+        _run_frame_extraction, video_path, Path(job["job_dir"]), config
+    )
+    _update_stage(
+        job_id,
+        "frame_extraction",
+        "completed",
+        f"{len(sharp_frames)}/{len(all_frames)} sharp frames",
+    )
+    job["frames"] = (all_frames, sharp_frames)
 
 
-async def process_job(job_id: str):
-    """Run the full video-to-splat pipeline for a job."""
-    job = jobs.get(job_id)
-    if not job:
-        return
+async def _gpu_stage(job_id: str, job: dict):
+    """Stages 2-3 (GPU): pose estimation + training, holding a gpu_sem slot."""
+    config: JobConfig = job["config"]
+    job_dir = Path(job["job_dir"])
+    all_frames, sharp_frames = job.pop("frames")
 
-    # Wait for GPU lock (serializes GPU work)
-    async with gpu_lock:
-        job["status"] = JobStatus.PROCESSING
-        config: JobConfig = job["config"]
-        job_dir = Path(job["job_dir"])
-        video_path = Path(job["video_path"])
+    async with gpu_sem:
+        # Stage 2: Pose estimation (COLMAP primary, DUSt3R fallback). COLMAP
+        # registers the full set then filters to sharp; it returns the actual
+        # (sharp, registered) frames, so rebind frame_paths to stay aligned
+        # with the poses. Intrinsics come back at the training resolution.
+        _update_stage(job_id, "pose_estimation", "running")
+        poses, intrinsics, points, colors, frame_paths, backend = await asyncio.to_thread(
+            _run_pose_estimation, all_frames, sharp_frames, config
+        )
+        _update_stage(
+            job_id,
+            "pose_estimation",
+            "completed",
+            f"{backend}: {len(points)} points, {len(poses)} cameras",
+        )
 
-        try:
-            # Stage 1: Frame extraction. all_frames = full evenly-spaced set (for
-            # COLMAP); sharp_frames = blur-filtered subset (for training).
-            _update_stage(job_id, "frame_extraction", "running")
-            all_frames, sharp_frames = await asyncio.to_thread(
-                _run_frame_extraction, video_path, job_dir, config
-            )
-            _update_stage(
-                job_id,
-                "frame_extraction",
-                "completed",
-                f"{len(sharp_frames)}/{len(all_frames)} sharp frames",
-            )
+        # Stage 3: Training
+        _update_stage(job_id, "training", "running")
 
-            # Stage 2: Pose estimation (COLMAP primary, DUSt3R fallback). COLMAP
-            # registers the full set then filters to sharp; it returns the actual
-            # (sharp, registered) frames, so rebind frame_paths to stay aligned
-            # with the poses. Intrinsics come back at the training resolution.
-            _update_stage(job_id, "pose_estimation", "running")
-            poses, intrinsics, points, colors, frame_paths, backend = await asyncio.to_thread(
-                _run_pose_estimation, all_frames, sharp_frames, config
-            )
+        # Training reports from its worker thread; clients poll at >1s, so
+        # keep at most one status update per second (plus the final step).
+        last_update = [0.0]
+
+        def on_progress(step: int, loss: float):
+            now = time.monotonic()
+            # train_gaussians reports every 50 steps, so the final report is
+            # the first one within 50 steps of the end
+            is_last = step >= config.training_iterations - 50
+            if now - last_update[0] < 1.0 and not is_last:
+                return
+            last_update[0] = now
             _update_stage(
                 job_id,
-                "pose_estimation",
-                "completed",
-                f"{backend}: {len(points)} points, {len(poses)} cameras",
+                "training",
+                "running",
+                f"step {step}/{config.training_iterations}, loss={loss:.4f}",
             )
 
-            # Stage 3: Training
-            _update_stage(job_id, "training", "running")
-
-            def on_progress(step: int, loss: float):
-                _update_stage(
-                    job_id,
-                    "training",
-                    "running",
-                    f"step {step}/{config.training_iterations}, loss={loss:.4f}",
-                )
-
-            # Refine poses only for DUSt3R (approximate); COLMAP poses are
-            # accurate and refining them warps the scene.
-            refine_poses = settings.pose_opt_enabled and backend == "dust3r"
-            ply_path = await asyncio.to_thread(
-                _run_training,
-                points,
-                colors,
-                poses,
-                intrinsics,
-                frame_paths,
-                config,
-                on_progress,
-                job_dir,
-                refine_poses,
-            )
-            _update_stage(job_id, "training", "completed")
+        # Refine poses only for DUSt3R (approximate); COLMAP poses are
+        # accurate and refining them warps the scene.
+        refine_poses = settings.pose_opt_enabled and backend == "dust3r"
+        ply_path = await asyncio.to_thread(
+            _run_training,
+            points,
+            colors,
+            poses,
+            intrinsics,
+            frame_paths,
+            config,
+            on_progress,
+            job_dir,
+            refine_poses,
+        )
+        _update_stage(job_id, "training", "completed")
 
-            # Stage 4: Cleanup — prune low-confidence Gaussians from the PLY
-            _update_stage(job_id, "cleanup", "running")
-            ply_path, cleanup_stats = await asyncio.to_thread(_run_cleanup, ply_path)
-            _update_stage(job_id, "cleanup", "completed", _cleanup_detail(cleanup_stats))
+    job["ply_path"] = ply_path
 
-            # Stage 5: Conversion (if splat format requested)
-            _update_stage(job_id, "conversion", "running")
-            result_path = await asyncio.to_thread(
-                _run_conversion, ply_path, config
-            )
-            _update_stage(job_id, "conversion", "completed")
 
-            # Done
-            job["status"] = JobStatus.COMPLETED
-            job["result_path"] = str(result_path)
-            logger.info("Job %s completed: %s", job_id, result_path)
+async def _convert_stage(job_id: str, job: dict):
+    """Stages 4-5 (CPU): Gaussian cleanup + format conversion, then finish."""
+    config: JobConfig = job["config"]
+    job_dir = Path(job["job_dir"])
+    ply_path = job.pop("ply_path")
 
-            # Clean up intermediate files
-            cleanup_job_dir(job_dir, keep_result=True)
+    # Stage 4: Cleanup — prune low-confidence Gaussians from the PLY
+    _update_stage(job_id, "cleanup", "running")
+    ply_path, cleanup_stats = await asyncio.to_thread(_run_cleanup, ply_path)
+    _update_stage(job_id, "cleanup", "completed", _cleanup_detail(cleanup_stats))
 
-        except Exception as e:
-            logger.exception("Job %s failed", job_id)
-            job["status"] = JobStatus.FAILED
-            job["error"] = str(e)
+    # Stage 5: Conversion (if splat format requested)
+    _update_stage(job_id, "conversion", "running")
+    result_path = await asyncio.to_thread(_run_conversion, ply_path, config)
+    _update_stage(job_id, "conversion", "completed")
 
-            # Mark remaining stages as failed
-            for stage in job["stages"]:
-                if stage["status"] in ("pending", "running"):
-                    stage["status"] = "failed"
+    # Done
+    job["status"] = JobStatus.COMPLETED
+    job["result_path"] = str(result_path)
+    logger.info("Job %s completed: %s", job_id, result_path)
+
+    # Clean up intermediate files (off the event loop; frames can be large)
+    await asyncio.to_thread(cleanup_job_dir, job_dir, keep_result=True)
 
 
 async def process_remote_job(
@@ -383,19 +573,22 @@ async def process_remote_job(
                     s["detail"] = detail
                 break
 
-    async with gpu_lock:
-        # Stage 1: Frame extraction
-        update_stage("frame_extraction", "running")
-        await report_stages()
-        all_frames, sharp_frames = await asyncio.to_thread(
-            _run_frame_extraction, video_path, job_dir, config
-        )
-        update_stage(
-            "frame_extraction", "completed",
-            f"{len(sharp_frames)}/{len(all_frames)} sharp frames",
-        )
-        await report_stages()
+    # Stage 1: Frame extraction
+    update_stage("frame_extraction", "running")
+    await report_stages()
+    await _probe_video(video_path)
+    all_frames, sharp_frames = await asyncio.to_thread(
+        _run_frame_extraction, video_path, job_dir, config
+    )
+    update_stage(
+        "frame_extraction", "completed",
+        f"{len(sharp_frames)}/{len(all_frames)} sharp frames",
+    )
+    await report_stages()
 
+    # Only the GPU stages hold a gpu_sem slot (as in _gpu_stage), so direct
+    # uploads can use the GPU while this job extracts frames or converts.
+    async with gpu_sem:
         # Stage 2: Pose estimation (COLMAP primary, DUSt3R fallback). COLMAP runs
         # on the full set then filters to sharp; it returns the actual (sharp,
         # registered) frames, so rebind frame_paths to stay aligned with the poses.
@@ -418,15 +611,13 @@ async def process_remote_job(
         loop = asyncio.get_event_loop()
 
         def on_progress(step: int, loss: float):
-            import time
-
             update_stage(
                 "training",
                 "running",
                 f"step {step}/{config.training_iterations}, loss={loss:.4f}",
             )
             # Throttle status reports to avoid hammering the API
-            now = time.time()
+            now = time.monotonic()
             if now - last_report[0] > 5:
                 last_report[0] = now
                 asyncio.run_coroutine_threadsafe(report_stages(), loop)
@@ -438,31 +629,48 @@ async def process_remote_job(
         update_stage("training", "completed")
         await report_stages()
 
-        # Stage 4: Cleanup — prune low-confidence Gaussians from the PLY
-        update_stage("cleanup", "running")
-        await report_stages()
-        ply_path, cleanup_stats = await asyncio.to_thread(_run_cleanup, ply_path)
-        update_stage("cleanup", "completed", _cleanup_detail(cleanup_stats))
-        await report_stages()
+    # Stage 4: Cleanup — prune low-confidence Gaussians from the PLY
+    update_stage("cleanup", "running")
+    await report_stages()
+    ply_path, cleanup_stats = await asyncio.to_thread(_run_cleanup, ply_path)
+    update_stage("cleanup", "completed", _cleanup_detail(cleanup_stats))
+    await report_stages()
 
-        # Stage 5: Conversion
-        update_stage("conversion", "running")
-        await report_stages()
-        result_path = await asyncio.to_thread(_run_conversion, ply_path, config)
-        update_stage("conversion", "completed")
-        await report_stages()
+    # Stage 5: Conversion
+    update_stage("conversion", "running")
+    await report_stages()
+    result_path = await asyncio.to_thread(_run_conversion, ply_path, config)
+    update_stage("conversion", "completed")
+    await report_stages()
 
-        # Clean up intermediate files
-        cleanup_job_dir(job_dir, keep_result=True)
+    # Clean up intermediate files (off the event loop; frames can be large)
+    await asyncio.to_thread(cleanup_job_dir, job_dir, keep_result=True)
 
-        return result_path
+    return result_path
+
+
+async def _probe_video(video_path: Path):
+    """Probe the video with an async ffprobe so the blocking extraction thread
+    finds the metadata cached. Non-fatal: on failure, frame extraction probes
+    again and falls back to normalizing the video."""
+    from worker.pipeline.frames import get_video_info_async
+
+    try:
+        await get_video_info_async(video_path)
+    except Exception as e:
+        logger.warning("Async video probe failed (%s); extraction will retry", e)
 
 
 def _run_frame_extraction(video_path: Path, job_dir: Path, config: JobConfig):
     """Returns (all_frames, sharp_frames). all_frames is the full evenly-spaced
     extraction (kept on disk so COLMAP's sequential matcher sees even spacing);
     sharp_frames is the blur-filtered subset that TRAINING uses."""
-    from worker.pipeline.frames import extract_frames, filter_blurry_frames, normalize_video
+    from worker.pipeline.frames import (
+        discard_frames,
+        extract_frames,
+        filter_blurry_frames,
+        normalize_video,
+    )
 
     frames_dir = job_dir / "frames"
 
@@ -480,8 +688,7 @@ def _run_frame_extraction(video_path: Path, job_dir: Path, config: JobConfig):
             )
     except Exception as e:
         logger.warning("Direct frame extraction failed (%s); normalizing and retrying", e)
-        for f in frames_dir.glob("frame_*.png"):
-            f.unlink(missing_ok=True)
+        discard_frames(frames_dir)
         normalized = normalize_video(video_path)
         frame_paths = extract_frames(
             normalized, frames_dir, config.max_frames, config.resolution
@@ -542,4 +749,4 @@ def _run_conversion(ply_path: Path, config: JobConfig) -> Path:
     from worker.pipeline.convert import ply_to_splat
 
     splat_path = ply_path.with_suffix(".splat")
-    return ply_to_splat(ply_path, splat_path)
+    return ply_to_splat(ply_path, splat_path, fp16=settings.splat_fp16)
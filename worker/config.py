@@ -104,6 +104,9 @@ class Settings(BaseSettings):
     # use L1 only. 2 roughly halves SSIM cost with negligible quality impact.
     # Set to 1 to compute SSIM every step.
     ssim_every: int = 2
+    # L1 only for the first N steps: while the Gaussians are still coarse blobs
+    # the SSIM structure term adds cost but little signal. 0 = SSIM from step 0.
+    ssim_start_step: int = 500
     # Render this many cameras per training step in one rasterization call.
     # >1 improves GPU utilization (fewer, larger steps); 1 = original behavior.
     cameras_per_step: int = 1
@@ -115,11 +118,22 @@ class Settings(BaseSettings):
     densify_start: int = 500
     densify_end: int = 4000
     densify_interval: int = 100
-    # Mixed precision (autocast) around the loss math. gsplat's CUDA rasterizer
-    # runs fp32 regardless, so the gain is modest (mainly the SSIM conv) and it's
-    # off by default. No GradScaler is used, so the strategy's gradient-based
-    # densification thresholds stay in fp32.
+    # Mixed precision (bf16 autocast; fp16 on GPUs without bf16) around the loss
+    # math. gsplat's CUDA rasterizer runs fp32 regardless, so the gain is modest
+    # (mainly the SSIM conv) and it's off by default. No GradScaler is used, so
+    # the strategy's gradient-based densification thresholds stay in fp32.
     use_amp: bool = False
+    # torch.compile the per-step activations and photometric loss around the
+    # rasterizer (gsplat's CUDA kernels themselves are opaque to Inductor). Off
+    # by default: the first steps pay compile time, which only amortizes over
+    # long runs.
+    torch_compile: bool = False
+    # Packed rasterization with sparse gradients + SparseAdam: backward and the
+    # optimizer step touch only the Gaussians visible in the step's views rather
+    # than all N (large SH tensors make the dense path bandwidth-bound). Off by
+    # default: SparseAdam only updates moments for visible rows, which changes
+    # convergence vs dense Adam.
+    sparse_grad: bool = False
     # gsplat DefaultStrategy grow threshold (grow_grad2d). 0.0002 is gsplat's
     # default; higher = fewer Gaussians cloned/split = faster training. (The old
     # hand-rolled densifier used 0.00015, which over-grew under the new strategy
@@ -128,6 +142,11 @@ class Settings(BaseSettings):
     # clones into ~850k Gaussians, ~22% of them near-transparent floaters. 0.0003
     # densifies more conservatively -> fewer floaters/fog.
     densify_grad_thresh: float = 0.0003
+    # AbsGrad densification (DefaultStrategy only): accumulate per-pixel |grad|
+    # so opposing gradients in textured regions don't cancel and under-densify.
+    # AbsGrad magnitudes are larger; gsplat suggests grow_grad2d ~0.0008 with it,
+    # so raise densify_grad_thresh when enabling.
+    densify_absgrad: bool = False
     densify_max_gaussians: int = 1_000_000
     knn_k: int = 4
     # Densification strategy: "default" (classic grad-based grow/split/clone/prune)
@@ -186,6 +205,12 @@ class Settings(BaseSettings):
     # heavy floater load still gets trimmed instead of gutting the whole scene.
     cleanup_floater_max_remove_frac: float = 0.15
 
+    # Write .splat output as the 20-byte half-precision variant (16-byte header
+    # + fp16 positions/scales) instead of the standard 32-byte layout: 37.5%
+    # smaller files and downloads. OFF by default — standard .splat viewers
+    # (including web-viewer/) can't read it.
+    splat_fp16: bool = False
+
     # Preview thumbnail (rendered after training for client previews)
     preview_max_dim: int = 1024
     preview_webp_quality: int = 85
@@ -197,7 +222,23 @@ class Settings(BaseSettings):
 
     # GPU
     gpu_device: str = "cuda:0"
+    # Per-job share of GPU memory. Also sets how many jobs may run the GPU
+    # stages concurrently: int(1 / fraction) slots (0.9 → 1, 0.45 → 2, ...).
     max_gpu_memory_fraction: float = 0.9
+    # Run gc + empty_cache after every training job, returning cached VRAM to
+    # the driver. Only useful when other processes share the GPU.
+    aggressive_gpu_cleanup: bool = False
+
+    # Redis job store (optional — set SPLAT_REDIS_URL to persist direct-upload
+    # jobs and their queue across restarts / share them between replicas that
+    # mount the same jobs_dir). Unset = in-memory only.
+    redis_url: str = ""
+    # A claimed job with no record update for this long is assumed to belong
+    # to a dead worker and is requeued. Live workers heartbeat the jobs they
+    # hold every redis_reclaim_interval_s, so this only needs to cover a few
+    # missed heartbeats.
+    redis_visibility_timeout_s: int = 7200
+    redis_reclaim_interval_s: int = 60
 
     # Queue (optional — set SPLAT_QUEUE_URL to enable remote job polling)
     queue_url: str = ""
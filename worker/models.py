@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 from datetime import datetime
@@ -23,6 +24,19 @@ class JobConfig(BaseModel):
     resolution: int = Field(default=768, ge=256, le=1920)
 
 
+PIPELINE_STAGES = ("frame_extraction", "pose_estimation", "training", "cleanup", "conversion")
+
+
+@dataclass(slots=True)
+class Stage:
+    """In-memory stage state for a direct-upload job (updated on every
+    training progress callback; serialized as StageProgress)."""
+
+    name: str
+    status: str = "pending"
+    detail: Optional[str] = None
+
+
 class StageProgress(BaseModel):
     name: str
     status: str = "pending"
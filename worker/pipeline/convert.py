@@ -1,82 +1,212 @@
 import logging
-from io import BytesIO
+import os
 from pathlib import Path
 
 import numpy as np
+from numpy.lib.recfunctions import repack_fields
 from plyfile import PlyData
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional; ply_to_splat falls back to NumPy
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 SH_C0 = 0.28209479177387814
 
+# PLY vertex properties read by ply_to_splat
+SPLAT_PLY_FIELDS = [
+    "x", "y", "z",
+    "scale_0", "scale_1", "scale_2",
+    "opacity",
+    "f_dc_0", "f_dc_1", "f_dc_2",
+    "rot_0", "rot_1", "rot_2", "rot_3",
+]
 
-def ply_to_splat(ply_path: Path, output_path: Path) -> Path:
-    """Convert a 3DGS PLY file to .splat binary format (vectorized)."""
-    plydata = PlyData.read(str(ply_path))
-    vert = plydata["vertex"]
-    n = len(vert.data)
-    logger.info("Converting PLY with %d gaussians to SPLAT", n)
+# One .splat record (32 bytes, packed little-endian)
+SPLAT_DTYPE = np.dtype(
+    [("pos", "<f4", 3), ("scale", "<f4", 3), ("rgba", "u1", 4), ("quat", "u1", 4)]
+)
 
-    # Extract all arrays at once
-    x = vert["x"].astype(np.float32)
-    y = vert["y"].astype(np.float32)
-    z = vert["z"].astype(np.float32)
-    scale_0 = vert["scale_0"].astype(np.float32)
-    scale_1 = vert["scale_1"].astype(np.float32)
-    scale_2 = vert["scale_2"].astype(np.float32)
-    opacity = vert["opacity"].astype(np.float32)
-    f_dc_0 = vert["f_dc_0"].astype(np.float32)
-    f_dc_1 = vert["f_dc_1"].astype(np.float32)
-    f_dc_2 = vert["f_dc_2"].astype(np.float32)
-    rot_0 = vert["rot_0"].astype(np.float32)
-    rot_1 = vert["rot_1"].astype(np.float32)
-    rot_2 = vert["rot_2"].astype(np.float32)
-    rot_3 = vert["rot_3"].astype(np.float32)
-
-    # Sort by importance: -exp(s0+s1+s2) / sigmoid(opacity)
-    importance = -np.exp(scale_0 + scale_1 + scale_2) / (1.0 + np.exp(-opacity))
-    order = np.argsort(importance)
-
-    # Apply sort order
-    x, y, z = x[order], y[order], z[order]
-    scale_0, scale_1, scale_2 = scale_0[order], scale_1[order], scale_2[order]
-    opacity = opacity[order]
-    f_dc_0, f_dc_1, f_dc_2 = f_dc_0[order], f_dc_1[order], f_dc_2[order]
-    rot_0, rot_1, rot_2, rot_3 = rot_0[order], rot_1[order], rot_2[order], rot_3[order]
-
-    # Build output buffer: 32 bytes per gaussian
-    # [position: 3xf32][scales: 3xf32][color: 4xu8][rotation: 4xu8]
-    buf = np.empty((n, 32), dtype=np.uint8)
+# Half-precision variant (opt-in, NOT readable by standard .splat viewers): a
+# 16-byte header, then 20-byte records. Positions are stored relative to the
+# header's scene bbox center for better fp16 dynamic range.
+SPLAT_FP16_MAGIC = b"SPH\x01"  # last byte = format version
+SPLAT_FP16_HEADER_DTYPE = np.dtype([("magic", "S4"), ("center", "<f4", 3)])
+SPLAT_FP16_DTYPE = np.dtype(
+    [("pos", "<f2", 3), ("scale", "<f2", 3), ("rgba", "u1", 4), ("quat", "u1", 4)]
+)
+
+
+if njit is not None:
 
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _pack_splat_kernel(
+        x, y, z, s0, s1, s2, op, fd0, fd1, fd2, r0, r1, r2, r3,
+        order, pos, scale, rgba, quat,
+    ):
+        """Per-gaussian .splat packing, parallel over gaussians. Output row idx
+        is input row order[idx]; all temporaries stay in registers."""
+        for idx in prange(order.shape[0]):
+            i = order[idx]
+            pos[idx, 0] = x[i]
+            pos[idx, 1] = y[i]
+            pos[idx, 2] = z[i]
+            scale[idx, 0] = np.exp(s0[i])
+            scale[idx, 1] = np.exp(s1[i])
+            scale[idx, 2] = np.exp(s2[i])
+            rgba[idx, 0] = np.uint8(min(max((0.5 + SH_C0 * fd0[i]) * 255.0, 0.0), 255.0))
+            rgba[idx, 1] = np.uint8(min(max((0.5 + SH_C0 * fd1[i]) * 255.0, 0.0), 255.0))
+            rgba[idx, 2] = np.uint8(min(max((0.5 + SH_C0 * fd2[i]) * 255.0, 0.0), 255.0))
+            a = 255.0 / (1.0 + np.exp(-op[i]))
+            rgba[idx, 3] = np.uint8(min(max(a, 0.0), 255.0))
+            q0, q1, q2, q3 = r0[i], r1[i], r2[i], r3[i]
+            inv = 128.0 / max(np.sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3), 1e-10)
+            quat[idx, 0] = np.uint8(min(max(q0 * inv + 128.0, 0.0), 255.0))
+            quat[idx, 1] = np.uint8(min(max(q1 * inv + 128.0, 0.0), 255.0))
+            quat[idx, 2] = np.uint8(min(max(q2 * inv + 128.0, 0.0), 255.0))
+            quat[idx, 3] = np.uint8(min(max(q3 * inv + 128.0, 0.0), 255.0))
+
+else:
+    _pack_splat_kernel = None
+
+
+def _pack_splat_numpy(rec: np.ndarray, out: np.ndarray):
+    """Fill .splat records from importance-sorted PLY records (NumPy path).
+
+    Each field is written straight into its final byte offset in ``out`` (no
+    per-field temporaries or .tobytes() copy).
+    """
     # Position (12 bytes)
-    positions = np.stack([x, y, z], axis=-1)  # (N, 3) float32
-    buf[:, 0:12] = positions.view(np.uint8).reshape(n, 12)
-
-    # Scales (12 bytes) - exponentiated
-    scales = np.exp(np.stack([scale_0, scale_1, scale_2], axis=-1))
-    buf[:, 12:24] = scales.view(np.uint8).reshape(n, 12)
-
-    # Color (4 bytes) - SH_C0 conversion + sigmoid opacity
-    r = np.clip((0.5 + SH_C0 * f_dc_0) * 255, 0, 255).astype(np.uint8)
-    g = np.clip((0.5 + SH_C0 * f_dc_1) * 255, 0, 255).astype(np.uint8)
-    b = np.clip((0.5 + SH_C0 * f_dc_2) * 255, 0, 255).astype(np.uint8)
-    a = np.clip((1.0 / (1.0 + np.exp(-opacity))) * 255, 0, 255).astype(np.uint8)
-    buf[:, 24] = r
-    buf[:, 25] = g
-    buf[:, 26] = b
-    buf[:, 27] = a
+    pos = out["pos"]
+    pos[:, 0] = rec["x"]
+    pos[:, 1] = rec["y"]
+    pos[:, 2] = rec["z"]
+
+    # Scales (12 bytes) - exponentiated in place
+    scale = out["scale"]
+    scale[:, 0] = rec["scale_0"]
+    scale[:, 1] = rec["scale_1"]
+    scale[:, 2] = rec["scale_2"]
+    np.exp(scale, out=scale)
+
+    # Color (4 bytes) - SH_C0 conversion + sigmoid opacity, built in one (N, 4)
+    # float buffer so the scale/clip/quantize run as single 4-wide passes
+    rgba_f = np.empty((len(rec), 4), dtype=np.float32)
+    rgba_f[:, 0] = 0.5 + SH_C0 * rec["f_dc_0"]
+    rgba_f[:, 1] = 0.5 + SH_C0 * rec["f_dc_1"]
+    rgba_f[:, 2] = 0.5 + SH_C0 * rec["f_dc_2"]
+    alpha = rgba_f[:, 3]
+    np.negative(rec["opacity"], out=alpha)
+    np.exp(alpha, out=alpha)
+    alpha += 1.0
+    np.reciprocal(alpha, out=alpha)
+    rgba_f *= 255
+    np.clip(rgba_f, 0, 255, out=rgba_f)
+    out["rgba"] = rgba_f
 
     # Rotation (4 bytes) - normalized quaternion, quantized to uint8
-    quats = np.stack([rot_0, rot_1, rot_2, rot_3], axis=-1)
+    quats = np.stack([rec["rot_0"], rec["rot_1"], rec["rot_2"], rec["rot_3"]], axis=-1)
     norms = np.linalg.norm(quats, axis=-1, keepdims=True)
-    norms = np.maximum(norms, 1e-10)
-    quats_normed = quats / norms
-    quats_u8 = np.clip(quats_normed * 128 + 128, 0, 255).astype(np.uint8)
-    buf[:, 28:32] = quats_u8
+    np.maximum(norms, 1e-10, out=norms)
+    quats /= norms
+    quats *= 128
+    quats += 128
+    np.clip(quats, 0, 255, out=quats)
+    out["quat"] = quats
 
+
+def _to_fp16_records(out: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Repack 32-byte .splat records as 20-byte fp16 ones. Returns (header,
+    records); positions become offsets from the bbox center in the header."""
+    pos = out["pos"]
+    center = (pos.min(axis=0) + pos.max(axis=0)) * 0.5 if len(out) else np.zeros(3, np.float32)
+    header = np.zeros(1, dtype=SPLAT_FP16_HEADER_DTYPE)
+    header["magic"] = SPLAT_FP16_MAGIC
+    header["center"] = center
+
+    fp16_max = np.finfo(np.float16).max
+    rec = np.empty(len(out), dtype=SPLAT_FP16_DTYPE)
+    rec["pos"] = np.clip(pos - center, -fp16_max, fp16_max)
+    rec["scale"] = np.minimum(out["scale"], fp16_max)
+    rec["rgba"] = out["rgba"]
+    rec["quat"] = out["quat"]
+    return header, rec
+
+
+def ply_to_splat(ply_path: Path, output_path: Path, fp16: bool = False) -> Path:
+    """Convert a 3DGS PLY file to .splat binary format (vectorized).
+
+    fp16=True writes the 20-byte half-precision variant (see SPLAT_FP16_DTYPE)
+    instead of the standard 32-byte layout.
+    """
+    with open(ply_path, "rb") as f:
+        # plyfile memory-maps the vertex block, so the read below is page-fault
+        # driven. Ask the kernel for aggressive sequential readahead on this
+        # file (the mapping shares this open file's readahead state) and start
+        # prefetching now; matters on a cold cache for the ~100+ MB PLYs.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        plydata = PlyData.read(f)
+    vert = plydata["vertex"]
+    n = len(vert.data)
+    logger.info("Converting PLY with %d gaussians to SPLAT", n)
+
+    # Only the fields .splat needs (a trained PLY also carries 45 f_rest SH
+    # floats per vertex); packed so the sort below gathers 56 bytes per row.
+    data = repack_fields(vert.data[SPLAT_PLY_FIELDS])
+
+    # Sort by importance, largest exp(s0+s1+s2) * sigmoid(opacity) first. Sorted
+    # in log space, which is monotone-equivalent: -(s0+s1+s2) - log(sigmoid(o))
+    # = -(s0+s1+s2) + softplus(-o). One logaddexp instead of two exps + divide.
+    importance = np.logaddexp(0.0, -data["opacity"].astype(np.float32))
+    importance -= data["scale_0"]
+    importance -= data["scale_1"]
+    importance -= data["scale_2"]
+    order = np.argsort(importance, kind="stable")
+
+    # [position: 3xf32][scales: 3xf32][color: 4xu8][rotation: 4xu8]
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(buf.tobytes())
+    if fp16 or n == 0:
+        out = np.empty(n, dtype=SPLAT_DTYPE)
+    else:
+        # Pack straight into the memory-mapped output file: no in-process
+        # output buffer and no write() copy; the kernel writes the pages back
+        out = np.memmap(output_path, dtype=SPLAT_DTYPE, mode="w+", shape=(n,))
+    if _pack_splat_kernel is not None:
+        # Numba: reads unsorted rows through `order`, so no separate gather pass
+        _pack_splat_kernel(
+            data["x"], data["y"], data["z"],
+            data["scale_0"], data["scale_1"], data["scale_2"],
+            data["opacity"],
+            data["f_dc_0"], data["f_dc_1"], data["f_dc_2"],
+            data["rot_0"], data["rot_1"], data["rot_2"], data["rot_3"],
+            order,
+            out["pos"], out["scale"], out["rgba"], out["quat"],
+        )
+    else:
+        # Apply sort order with a single gather over the packed records, rather
+        # than one fancy-index copy per column
+        _pack_splat_numpy(data[order], out)
+
+    if fp16:
+        header, out = _to_fp16_records(out)
+        with open(output_path, "wb") as f:
+            header.tofile(f)
+            out.tofile(f)
+        size_mb = (header.nbytes + out.nbytes) / 1e6
+    else:
+        if isinstance(out, np.memmap):
+            out.flush()
+        else:
+            out.tofile(output_path)
+        size_mb = out.nbytes / 1e6
+    del out  # release the mapping before the caller reads the file
 
-    logger.info("Wrote SPLAT file: %s (%d gaussians, %.1f MB)", output_path, n, n * 32 / 1e6)
+    logger.info(
+        "Wrote SPLAT file: %s (%d gaussians, %.1f MB%s)",
+        output_path, n, size_mb, ", fp16" if fp16 else "",
+    )
     return output_path
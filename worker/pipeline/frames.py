@@ -1,6 +1,13 @@
+import asyncio
+import functools
 import json
 import logging
+import os
+import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
@@ -10,10 +17,31 @@ from worker.config import settings
 
 logger = logging.getLogger(__name__)
 
+# ffprobe only reads container headers; anything slower than this is a hang
+FFPROBE_TIMEOUT = 10
 
-def _run_cmd(cmd: list[str], description: str) -> subprocess.CompletedProcess:
+# get_video_info results keyed by (resolved path, mtime_ns), so repeated probes
+# of the same file (extraction fallbacks, the async pre-probe) skip the fork.
+_VIDEO_INFO_CACHE_SIZE = 64
+_video_info_cache: OrderedDict[tuple[str, int], dict] = OrderedDict()
+_video_info_lock = threading.Lock()
+
+# NVDEC scene detection reads its on-device scores back in batches instead of
+# per frame, holding each pending frame as a device copy until then. The batch
+# is sized to this many bytes of copies (~21 frames at 1080p, 5 at 4K): the
+# frame stage runs outside gpu_sem, next to a training job under the same
+# process-wide memory cap, so its footprint must stay small.
+NVDEC_PENDING_BYTES = 64 << 20
+
+# pts_time of each frame in ffmpeg's metadata=print output
+_PTS_TIME_RE = re.compile(r"pts_time:([0-9.]+)")
+
+
+def _run_cmd(
+    cmd: list[str], description: str, timeout: float = 120
+) -> subprocess.CompletedProcess:
     logger.info("Running %s: %s", description, " ".join(cmd))
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
     if result.returncode != 0:
         detail = (result.stderr or result.stdout or "").strip() or "(no output)"
         raise RuntimeError(
@@ -31,7 +59,7 @@ def normalize_video(video_path: Path) -> Path:
         "-show_streams",
         str(video_path),
     ]
-    result = _run_cmd(cmd, "ffprobe codec check")
+    result = _run_cmd(cmd, "ffprobe codec check", timeout=FFPROBE_TIMEOUT)
     info = json.loads(result.stdout)
     video_stream = next(
         (s for s in info.get("streams", []) if s["codec_type"] == "video"), None
@@ -64,13 +92,12 @@ def normalize_video(video_path: Path) -> Path:
     return normalized_path
 
 
-def get_video_info(video_path: Path) -> dict:
-    """Get video metadata via ffprobe."""
+def _video_info_cmd(video_path: Path) -> list[str]:
     # NOTE: don't add `-show_entries stream_side_data=...` — that section only
     # exists in ffmpeg 5.x+, and Ubuntu 22.04 ships 4.4. `-show_streams` already
     # emits `side_data_list` (with rotation) on both, and we fall back to the
     # legacy `tags.rotate` below, so rotation is covered without the fragile flag.
-    cmd = [
+    return [
         settings.ffprobe_path,
         "-v", "error",
         "-print_format", "json",
@@ -78,8 +105,70 @@ def get_video_info(video_path: Path) -> dict:
         "-show_format",
         str(video_path),
     ]
-    result = _run_cmd(cmd, "ffprobe")
-    info = json.loads(result.stdout)
+
+
+def _video_info_key(video_path: Path) -> tuple[str, int]:
+    return str(video_path.resolve()), video_path.stat().st_mtime_ns
+
+
+def _cached_video_info(key: tuple[str, int]) -> dict | None:
+    with _video_info_lock:
+        info = _video_info_cache.get(key)
+        if info is not None:
+            _video_info_cache.move_to_end(key)
+            return dict(info)
+    return None
+
+
+def _cache_video_info(key: tuple[str, int], info: dict):
+    with _video_info_lock:
+        _video_info_cache[key] = info
+        _video_info_cache.move_to_end(key)
+        while len(_video_info_cache) > _VIDEO_INFO_CACHE_SIZE:
+            _video_info_cache.popitem(last=False)
+
+
+def get_video_info(video_path: Path) -> dict:
+    """Get video metadata via ffprobe (memoized per file path + mtime)."""
+    key = _video_info_key(video_path)
+    info = _cached_video_info(key)
+    if info is not None:
+        return info
+    result = _run_cmd(_video_info_cmd(video_path), "ffprobe", timeout=FFPROBE_TIMEOUT)
+    info = _parse_video_info(result.stdout)
+    _cache_video_info(key, info)
+    return dict(info)
+
+
+async def get_video_info_async(video_path: Path) -> dict:
+    """Async get_video_info: runs ffprobe without tying up a thread, and fills
+    the same cache, so a later get_video_info on this file doesn't re-probe."""
+    key = _video_info_key(video_path)
+    info = _cached_video_info(key)
+    if info is not None:
+        return info
+    cmd = _video_info_cmd(video_path)
+    logger.info("Running ffprobe (async): %s", " ".join(cmd))
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), FFPROBE_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise RuntimeError(f"ffprobe timed out after {FFPROBE_TIMEOUT}s")
+    if proc.returncode != 0:
+        detail = (stderr or stdout).decode(errors="replace").strip() or "(no output)"
+        raise RuntimeError(f"ffprobe failed (exit {proc.returncode}): {detail[:500]}")
+    info = _parse_video_info(stdout.decode())
+    _cache_video_info(key, info)
+    return dict(info)
+
+
+def _parse_video_info(ffprobe_json: str) -> dict:
+    """Extract the fields we use from ffprobe's -show_streams/-show_format JSON."""
+    info = json.loads(ffprobe_json)
     video_stream = next(
         (s for s in info.get("streams", []) if s["codec_type"] == "video"), None
     )
@@ -88,6 +177,10 @@ def get_video_info(video_path: Path) -> dict:
     duration = float(info.get("format", {}).get("duration", 0))
     fps_parts = video_stream.get("r_frame_rate", "30/1").split("/")
     fps = float(fps_parts[0]) / float(fps_parts[1]) if len(fps_parts) == 2 else 30.0
+    # Frame timestamps (pts_time, select's t) are offset by the stream's start
+    tb_parts = video_stream.get("time_base", "1/90000").split("/")
+    time_base = float(tb_parts[0]) / float(tb_parts[1]) if len(tb_parts) == 2 else 1 / 90000
+    start_time = float(video_stream.get("start_time") or 0.0)
 
     w = int(video_stream["width"])
     h = int(video_stream["height"])
@@ -95,14 +188,17 @@ def get_video_info(video_path: Path) -> dict:
     # iOS MOV files store rotation as metadata rather than rotating pixels.
     # ffmpeg auto-rotates during decoding, so the actual output dimensions
     # are swapped for 90/270 degree rotations. Match that here.
+    # Normalized to clockwise degrees in [0, 360): the display-matrix side data
+    # is counter-clockwise, the legacy tag clockwise.
     rotation = 0
     for side_data in video_stream.get("side_data_list", []):
         if "rotation" in side_data:
-            rotation = abs(int(side_data["rotation"]))
+            rotation = -int(side_data["rotation"])
             break
     # Also check the older top-level tag format
     if rotation == 0:
-        rotation = abs(int(video_stream.get("tags", {}).get("rotate", 0)))
+        rotation = int(video_stream.get("tags", {}).get("rotate", 0))
+    rotation %= 360
 
     if rotation in (90, 270):
         w, h = h, w
@@ -114,9 +210,28 @@ def get_video_info(video_path: Path) -> dict:
         "duration": duration,
         "fps": fps,
         "total_frames": int(duration * fps) if duration else 0,
+        "time_base": time_base,
+        "start_time": start_time,
+        "rotation": rotation,
     }
 
 
+def discard_frames(output_dir: Path):
+    """Set aside a failed extraction's frames before retrying into output_dir.
+
+    One directory rename instead of a per-file unlink on the critical path; the
+    job's cleanup (cleanup_job_dir / remove_job_dir) deletes the set-aside
+    directory along with everything else.
+    """
+    if not output_dir.exists():
+        return
+    k = 0
+    while (aside := output_dir.with_name(f"{output_dir.name}_discarded_{k}")).exists():
+        k += 1
+    output_dir.rename(aside)
+    output_dir.mkdir(parents=True)
+
+
 def extract_frames(
     video_path: Path,
     output_dir: Path,
@@ -141,19 +256,19 @@ def extract_frames(
     # "scene" mode is available via config. Each falls back to the other if it
     # yields too few frames.
     if settings.frame_extraction_mode == "scene":
-        frames = _extract_scene_frames(
-            video_path, output_dir, max_frames, scale_filter, settings.scene_change_threshold
+        frames, frame_times = _extract_scene_frames(
+            video_path, output_dir, max_frames, scale_filter, settings.scene_change_threshold,
+            video_info, resolution,
         )
         if len(frames) < settings.min_frames:
             logger.info(
-                "Scene detection yielded %d frames (< %d), falling back to uniform sampling",
+                "Scene detection yielded %d frames (< %d), topping up with uniform sampling",
                 len(frames),
                 settings.min_frames,
             )
-            for f in frames:
-                f.unlink(missing_ok=True)
-            frames = _extract_uniform_frames(
-                video_path, output_dir, max_frames, scale_filter, video_info
+            frames = _supplement_uniform_frames(
+                video_path, output_dir, frames, frame_times, max_frames, scale_filter,
+                video_info,
             )
     else:
         frames = _extract_uniform_frames(
@@ -165,46 +280,306 @@ def extract_frames(
                 len(frames),
                 settings.min_frames,
             )
-            for f in frames:
-                f.unlink(missing_ok=True)
-            frames = _extract_scene_frames(
-                video_path, output_dir, max_frames, scale_filter, settings.scene_change_threshold
+            discard_frames(output_dir)
+            frames, _ = _extract_scene_frames(
+                video_path, output_dir, max_frames, scale_filter, settings.scene_change_threshold,
+                video_info, resolution,
             )
 
     logger.info("Extracted %d frames", len(frames))
     return frames
 
 
+@functools.lru_cache(maxsize=1)
+def _scale_cuda_support() -> tuple[bool, bool]:
+    """(has scale_cuda, scale_cuda takes format=) for the configured ffmpeg,
+    probed once. Distro builds (e.g. Ubuntu 22.04's 4.4) usually lack the
+    filter entirely, and its format option only exists from ffmpeg 5."""
+    try:
+        result = subprocess.run(
+            [settings.ffmpeg_path, "-hide_banner", "-h", "filter=scale_cuda"],
+            capture_output=True, text=True, timeout=FFPROBE_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False, False
+    help_text = result.stdout
+    if "Filter scale_cuda" not in help_text:
+        return False, False
+    return True, re.search(r"^\s+format\b", help_text, re.MULTILINE) is not None
+
+
+def _cuda_scale_filter(scale_filter: str) -> str | None:
+    """On-device equivalent of a CPU "scale=W:H" filter, for decoding with
+    -hwaccel_output_format cuda: scale on the GPU, then download only the
+    downscaled frame for PNG encoding. None if this ffmpeg has no scale_cuda."""
+    has_filter, has_format = _scale_cuda_support()
+    if not has_filter:
+        return None
+    gpu_scale = scale_filter.replace("scale=", "scale_cuda=", 1)
+    if has_format:
+        return f"{gpu_scale}:format=yuv420p,hwdownload,format=yuv420p"
+    # Older scale_cuda keeps the decoder's surface format (nv12 for 8-bit
+    # video; 10-bit sources fail here and fall back to CPU scaling)
+    return f"{gpu_scale},hwdownload,format=nv12"
+
+
+def _run_ffmpeg_frames(
+    video_path: Path,
+    vf: str,
+    vf_cuda: str | None,
+    output_args: list[str],
+    description: str,
+) -> subprocess.CompletedProcess:
+    """Run an ffmpeg frame extraction on the fastest path that works:
+
+    1. vf_cuda (if given): NVDEC decode, frames stay on the GPU through scaling
+    2. vf with -hwaccel cuda: NVDEC decode, CPU scaling (e.g. ffmpeg builds
+       without scale_cuda)
+    3. vf without hwaccel (no CUDA decode available)
+    """
+    attempts = []
+    if vf_cuda is not None:
+        attempts.append((["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"], vf_cuda, ""))
+        attempts.append((["-hwaccel", "cuda"], vf, " (CPU scale)"))
+    else:
+        attempts.append((["-hwaccel", "cuda"], vf, ""))
+    attempts.append(([], vf, " (CPU)"))
+
+    for k, (input_args, filters, suffix) in enumerate(attempts):
+        cmd = [
+            settings.ffmpeg_path, *input_args, "-i", str(video_path), "-vf", filters,
+            *output_args,
+        ]
+        try:
+            return _run_cmd(cmd, description + suffix)
+        except RuntimeError:
+            if k == len(attempts) - 1:
+                raise
+            logger.warning("%s failed, falling back", description + suffix)
+
+
 def _extract_scene_frames(
     video_path: Path,
     output_dir: Path,
     max_frames: int,
     scale_filter: str,
     threshold: float,
-) -> list[Path]:
-    """Extract frames at scene changes using ffmpeg select filter."""
+    video_info: dict | None = None,
+    resolution: int | None = None,
+) -> tuple[list[Path], list[float]]:
+    """Extract frames at scene changes. Uses NVDEC decode + on-GPU frame
+    differencing when PyNvVideoCodec is available, else ffmpeg's select filter.
+
+    Returns (frames, frame_times): the source timestamp (seconds, as ffmpeg's
+    pts_time) of each extracted frame, so a too-sparse result can be topped up
+    without re-extracting.
+    """
+    if video_info is not None and resolution is not None:
+        result = _extract_scene_frames_nvdec(
+            video_path, output_dir, max_frames, resolution, threshold, video_info
+        )
+        if result is not None:
+            return result
+
+    # metadata=print reports each selected frame's pts_time on stdout
+    # (The scene score needs CPU frames, so there's no on-device scale variant.)
     output_pattern = str(output_dir / "frame_%04d.png")
-    cmd = [
-        settings.ffmpeg_path,
-        "-hwaccel", "cuda",
-        "-i", str(video_path),
-        "-vf", f"select='gt(scene,{threshold})',{scale_filter}",
-        "-vsync", "vfr",
-        "-frames:v", str(max_frames),
-        "-q:v", "2",
-        output_pattern,
-        "-y",
-    ]
-    try:
-        _run_cmd(cmd, "ffmpeg scene extraction")
-    except RuntimeError:
-        # Retry without hwaccel if CUDA decode not available
-        logger.warning("CUDA hwaccel failed, retrying without")
-        cmd = [c for c in cmd if c != "cuda" and c != "-hwaccel"]
-        _run_cmd(cmd, "ffmpeg scene extraction (CPU)")
+    result = _run_ffmpeg_frames(
+        video_path,
+        f"select='gt(scene,{threshold})',metadata=print:file=-,{scale_filter}",
+        None,
+        ["-vsync", "vfr", "-frames:v", str(max_frames), "-q:v", "2", output_pattern, "-y"],
+        "ffmpeg scene extraction",
+    )
 
     frames = sorted(output_dir.glob("frame_*.png"))
-    return frames
+    frame_times = [float(t) for t in _PTS_TIME_RE.findall(result.stdout)][: len(frames)]
+    return frames, frame_times
+
+
+def _supplement_uniform_frames(
+    video_path: Path,
+    output_dir: Path,
+    frames: list[Path],
+    frame_times: list[float],
+    max_frames: int,
+    scale_filter: str,
+    video_info: dict,
+) -> list[Path]:
+    """Top up a too-sparse scene-detection result with uniformly spaced frames
+    from the gaps between the frames already extracted. Keeps the scene frames
+    and selects the extra ones by timestamp in a single extra ffmpeg pass,
+    instead of discarding everything and re-extracting from scratch. The merged
+    set is renumbered so frame_NNNN.png stays in temporal order.
+
+    Works in timestamps rather than frame numbers, so variable-frame-rate
+    (phone) video and streams that don't start at t=0 place the gaps correctly.
+    """
+    duration = video_info["duration"]
+    if duration <= 0 or len(frame_times) != len(frames):
+        # Can't place gaps without a duration / timestamps; plain uniform
+        discard_frames(output_dir)
+        return _extract_uniform_frames(
+            video_path, output_dir, max_frames, scale_filter, video_info
+        )
+
+    # Uniform slot centers, minus any slot a scene frame already covers
+    spacing = duration / max_frames
+    candidates = video_info["start_time"] + (np.arange(max_frames) + 0.5) * spacing
+    if frame_times:
+        taken = np.asarray(frame_times)
+        dist = np.abs(candidates[:, None] - taken[None, :]).min(axis=1)
+        candidates = candidates[dist >= spacing / 2]
+    n_needed = max_frames - len(frames)
+    if len(candidates) > n_needed:
+        pick = np.unique(np.linspace(0, len(candidates) - 1, n_needed).round().astype(int))
+        candidates = candidates[pick]
+    if len(candidates) == 0:
+        return frames
+
+    # For each slot, the first frame at or after its time (prev_t is NaN on
+    # the first frame, so a slot before the first frame selects that frame)
+    select = "select='" + "+".join(
+        f"gte(t,{c:.6f})*not(gte(prev_t,{c:.6f}))" for c in candidates
+    ) + "'"
+    cuda_scale = _cuda_scale_filter(scale_filter)
+    _run_ffmpeg_frames(
+        video_path,
+        f"{select},{scale_filter}",
+        f"{select},{cuda_scale}" if cuda_scale else None,
+        [
+            "-vsync", "vfr", "-frames:v", str(len(candidates)), "-q:v", "2",
+            str(output_dir / "supp_%04d.png"), "-y",
+        ],
+        "ffmpeg supplemental uniform extraction",
+    )
+    supplemental = sorted(output_dir.glob("supp_*.png"))
+
+    merged = sorted(
+        zip(list(frame_times) + candidates[: len(supplemental)].tolist(), frames + supplemental)
+    )
+    # Two-step rename so new names never collide with not-yet-moved files
+    staged = []
+    for k, (_, path) in enumerate(merged):
+        tmp = output_dir / f"merge_{k:04d}.png"
+        path.rename(tmp)
+        staged.append(tmp)
+    result = []
+    for k, tmp in enumerate(staged):
+        dst = output_dir / f"frame_{k + 1:04d}.png"
+        tmp.rename(dst)
+        result.append(dst)
+    logger.info(
+        "Supplemented %d scene frames with %d uniform frames", len(frames), len(supplemental)
+    )
+    return result
+
+
+def _extract_scene_frames_nvdec(
+    video_path: Path,
+    output_dir: Path,
+    max_frames: int,
+    resolution: int,
+    threshold: float,
+    video_info: dict,
+) -> tuple[list[Path], list[float]] | None:
+    """Scene-change extraction fully on the GPU: decode with NVDEC, score each
+    frame with ffmpeg's scene metric on-device, and download only the selected
+    frames for PNG encoding.
+
+    The score matches ffmpeg's select filter, min(mafd, |mafd - prev_mafd|) / 100
+    with mafd the mean absolute luma difference to the previous frame, so the
+    same scene_change_threshold selects the same kind of cuts on either path
+    (the |Δmafd| term keeps a steady pan from firing on every frame).
+
+    ffmpeg's select filter runs on the CPU even with -hwaccel cuda, forcing a
+    GPU->CPU copy of every decoded frame; here only max_frames ever cross PCIe.
+    Scores are read back in batches of up to NVDEC_PENDING_BYTES of frames.
+    Returns (frames, frame_times) like _extract_scene_frames, or None (caller
+    falls back to ffmpeg) if PyNvVideoCodec isn't installed or decoding fails.
+    """
+    try:
+        import PyNvVideoCodec as nvc
+        import torch
+    except ImportError:
+        return None
+
+    rotate = {
+        90: cv2.ROTATE_90_CLOCKWISE,
+        180: cv2.ROTATE_180,
+        270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+    }.get(video_info.get("rotation", 0))
+    # Output size matching ffmpeg's scale=<res>:-2 / scale=-2:<res> on the
+    # displayed (post-rotation) frame: long edge = resolution, short edge even.
+    w, h = video_info["width"], video_info["height"]
+    if w >= h:
+        out_w, out_h = resolution, max(2, round(h * resolution / w / 2) * 2)
+    else:
+        out_w, out_h = max(2, round(w * resolution / h / 2) * 2), resolution
+
+    frames: list[Path] = []
+    frame_times: list[float] = []
+    # Frames decoded since the last score readback: (timestamp, NV12 copy,
+    # on-device score). Copies, because the decoder reuses its surfaces.
+    pending: list[tuple[float, "torch.Tensor", "torch.Tensor"]] = []
+
+    def flush() -> bool:
+        """Save the pending frames that pass the threshold; True when full."""
+        scores = torch.stack([score for _, _, score in pending]).tolist()
+        batch = pending.copy()
+        pending.clear()
+        for (t, nv12, _), score in zip(batch, scores):
+            if score <= threshold:
+                continue
+            bgr = cv2.cvtColor(nv12.cpu().numpy(), cv2.COLOR_YUV2BGR_NV12)
+            if rotate is not None:
+                bgr = cv2.rotate(bgr, rotate)
+            bgr = cv2.resize(bgr, (out_w, out_h), interpolation=cv2.INTER_AREA)
+            path = output_dir / f"frame_{len(frames) + 1:04d}.png"
+            cv2.imwrite(str(path), bgr)
+            frames.append(path)
+            frame_times.append(t)
+            if len(frames) >= max_frames:
+                return True
+        return False
+
+    try:
+        gpu_id = torch.device(settings.gpu_device).index or 0
+        demuxer = nvc.CreateDemuxer(filename=str(video_path))
+        decoder = nvc.CreateDecoder(
+            gpuid=gpu_id,
+            codec=demuxer.GetNvCodecId(),
+            cudacontext=0,
+            cudastream=0,
+            usedevicememory=True,
+        )
+        prev = None
+        prev_mafd = 0.0  # as in ffmpeg's select filter
+        for packet in demuxer:
+            for decoded in decoder.Decode(packet):
+                nv12 = torch.from_dlpack(decoded)  # (H*3/2, W) uint8, on device
+                luma_h = nv12.shape[0] * 2 // 3
+                # Subsampled luma is plenty for a global difference score
+                luma = nv12[:luma_h:4, ::4].float()
+                if prev is not None:
+                    mafd = (luma - prev).abs_().mean()  # 0-255 luma units
+                    score = torch.minimum(mafd, (mafd - prev_mafd).abs())
+                    prev_mafd = mafd
+                    t = decoded.getPTS() * video_info["time_base"]
+                    pending.append((t, nv12.clone(), score / 100.0))
+                    batch_size = max(1, NVDEC_PENDING_BYTES // nv12.numel())
+                    if len(pending) >= batch_size and flush():
+                        return frames, frame_times
+                prev = luma
+        if pending and flush():
+            return frames, frame_times
+    except Exception:
+        logger.warning("NVDEC scene extraction failed, falling back to ffmpeg", exc_info=True)
+        discard_frames(output_dir)
+        return None
+
+    logger.info("NVDEC scene extraction selected %d frames", len(frames))
+    return frames, frame_times
 
 
 def _extract_uniform_frames(
@@ -222,27 +597,27 @@ def _extract_uniform_frames(
     # Calculate interval to get max_frames evenly spaced
     fps_out = max_frames / duration
     output_pattern = str(output_dir / "frame_%04d.png")
-    cmd = [
-        settings.ffmpeg_path,
-        "-hwaccel", "cuda",
-        "-i", str(video_path),
-        "-vf", f"fps={fps_out:.4f},{scale_filter}",
-        "-frames:v", str(max_frames),
-        "-q:v", "2",
-        output_pattern,
-        "-y",
-    ]
-    try:
-        _run_cmd(cmd, "ffmpeg uniform extraction")
-    except RuntimeError:
-        logger.warning("CUDA hwaccel failed, retrying without")
-        cmd = [c for c in cmd if c != "cuda" and c != "-hwaccel"]
-        _run_cmd(cmd, "ffmpeg uniform extraction (CPU)")
+    cuda_scale = _cuda_scale_filter(scale_filter)
+    _run_ffmpeg_frames(
+        video_path,
+        f"fps={fps_out:.4f},{scale_filter}",
+        f"fps={fps_out:.4f},{cuda_scale}" if cuda_scale else None,
+        ["-frames:v", str(max_frames), "-q:v", "2", output_pattern, "-y"],
+        "ffmpeg uniform extraction",
+    )
 
     frames = sorted(output_dir.glob("frame_*.png"))
     return frames
 
 
+def _sharpness(path: Path) -> float:
+    """Laplacian variance of a grayscale frame; 0.0 if unreadable."""
+    img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return 0.0
+    return float(cv2.Laplacian(img, cv2.CV_32F).var())
+
+
 def filter_blurry_frames(
     frame_paths: list[Path],
     drop_ratio: float = 0.20,
@@ -252,16 +627,11 @@ def filter_blurry_frames(
     if len(frame_paths) <= min_keep:
         return frame_paths
 
-    sharpness = []
-    for path in frame_paths:
-        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
-        if img is None:
-            sharpness.append(0.0)
-            continue
-        lap_var = cv2.Laplacian(img, cv2.CV_64F).var()
-        sharpness.append(lap_var)
-
-    sharpness = np.array(sharpness)
+    # OpenCV releases the GIL, so decode + Laplacian parallelize across threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        sharpness = np.fromiter(
+            ex.map(_sharpness, frame_paths), dtype=np.float64, count=len(frame_paths)
+        )
     n_drop = max(0, int(len(frame_paths) * drop_ratio))
     n_keep = max(min_keep, len(frame_paths) - n_drop)
 
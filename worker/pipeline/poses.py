@@ -201,11 +201,13 @@ def _estimate_poses_dust3r(
     # Rescale intrinsics from DUSt3R's working resolution to the training
     # resolution (DUSt3R runs at its own fixed res; the trainer renders larger).
     if training_resolution != resolution:
+        # Rows 0-1 (fx, skew, cx / fy, cy) scale; row 2 stays [0, 0, 1]. One
+        # broadcast multiply over all K, no copy + per-row passes.
         scale_k = training_resolution / resolution
-        intrinsics = intrinsics.copy()
-        intrinsics[:, 0, :] *= scale_k  # fx, skew, cx
-        intrinsics[:, 1, :] *= scale_k  # fy, cy
-        intrinsics[:, 2, :] = [0, 0, 1]
+        scale_mat = np.array(
+            [[scale_k] * 3, [scale_k] * 3, [0, 0, 1]], dtype=intrinsics.dtype
+        )
+        intrinsics = intrinsics * scale_mat
 
     logger.info("DUSt3R results: %d poses, %d points", len(poses), len(points))
 
@@ -235,42 +237,32 @@ def _extract_point_cloud(scene, n_images: int) -> tuple[np.ndarray, np.ndarray]:
     pts3d_list = scene.get_pts3d()  # list of (H, W, 3) tensors
     confidence_list = scene.get_masks()  # list of (H, W) bool tensors
 
-    all_points = []
-    all_colors = []
-
-    imgs = scene.imgs  # list of (H, W, 3) numpy arrays
-
-    for i in range(n_images):
-        pts = pts3d_list[i].detach().cpu().numpy()  # (H, W, 3)
-        conf_mask = confidence_list[i].detach().cpu().numpy()  # (H, W) bool
-        img = imgs[i]  # (H, W, 3) float [0, 1]
+    imgs = scene.imgs  # list of (H, W, 3) numpy arrays, float [0, 1]
 
-        # Apply confidence mask
-        pts_masked = pts[conf_mask]  # (K, 3)
-        colors_masked = img[conf_mask]  # (K, 3)
+    # Filter all views at once on the device; only the surviving (K, 3) points
+    # and the (N, H, W) keep-mask cross to the host
+    pts = torch.stack([p.detach() for p in pts3d_list[:n_images]])  # (N, H, W, 3)
+    keep = torch.stack([c.detach() for c in confidence_list[:n_images]])  # (N, H, W)
+    keep &= torch.isfinite(pts).all(dim=-1)
 
-        # Filter out points with extreme coordinates (outliers)
-        valid = np.all(np.isfinite(pts_masked), axis=1)
-        if valid.sum() > 0:
-            pts_masked = pts_masked[valid]
-            colors_masked = colors_masked[valid]
+    # Remove statistical outliers: beyond 3 std from each view's mean over its
+    # confident, finite points (masked per-view reductions, population std).
+    # A view with no such points gets NaN stats, which keeps nothing.
+    m = keep.unsqueeze(-1)
+    count = keep.sum(dim=(1, 2)).unsqueeze(-1)  # (N, 1)
+    mean = torch.where(m, pts, 0.0).sum(dim=(1, 2)) / count  # (N, 3)
+    centered = pts - mean[:, None, None]
+    var = torch.where(m, centered.square(), 0.0).sum(dim=(1, 2)) / count
+    keep &= (centered.abs() < 3 * var.sqrt()[:, None, None]).all(dim=-1)
 
-            # Remove statistical outliers (beyond 3 std from mean)
-            mean = pts_masked.mean(axis=0)
-            std = pts_masked.std(axis=0)
-            inlier_mask = np.all(np.abs(pts_masked - mean) < 3 * std, axis=1)
-            pts_masked = pts_masked[inlier_mask]
-            colors_masked = colors_masked[inlier_mask]
-
-        all_points.append(pts_masked)
-        all_colors.append(colors_masked)
-
-    points = np.concatenate(all_points, axis=0).astype(np.float32)
-    colors = np.concatenate(all_colors, axis=0).astype(np.float32)
+    points = pts[keep].cpu().numpy().astype(np.float32)
+    colors = np.stack(imgs[:n_images])[keep.cpu().numpy()].astype(np.float32)
 
     # Subsample if too many points
     if len(points) > settings.dust3r_max_points:
-        indices = np.random.choice(len(points), settings.dust3r_max_points, replace=False)
+        indices = np.random.default_rng().choice(
+            len(points), settings.dust3r_max_points, replace=False, shuffle=False
+        )
         points = points[indices]
         colors = colors[indices]
         logger.info("Subsampled point cloud to %d points", len(points))
@@ -151,7 +151,9 @@ def estimate_poses_colmap(
 
     # Cap the init cloud like the DUSt3R path (sparse is usually well under this).
     if len(pts) > settings.dust3r_max_points:
-        idx = np.random.choice(len(pts), settings.dust3r_max_points, replace=False)
+        idx = np.random.default_rng().choice(
+            len(pts), settings.dust3r_max_points, replace=False, shuffle=False
+        )
         pts, cols = pts[idx], cols[idx]
 
     poses_arr = np.stack(poses, axis=0)
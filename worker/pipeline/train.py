@@ -1,31 +1,121 @@
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Callable, Optional
 
-import imageio.v3 as iio
 import numpy as np
 import torch
 import torch.nn.functional as F
-from torchmetrics.image import StructuralSimilarityIndexMeasure
 
 from worker.config import settings
-from worker.utils.gpu import force_gpu_cleanup, gpu_memory_guard
+from worker.utils.gpu import gpu_memory_guard
 
 logger = logging.getLogger(__name__)
 
 SH_C0 = 0.28209479177387814
 
+# Initial-scale kNN runs on the GPU (brute-force, O(M^2)) up to this many
+# points; larger clouds use the CPU KD-tree.
+KNN_GPU_MAX_POINTS = 300_000
+# Distance-matrix elements per kNN tile (256 MB of float32)
+KNN_GPU_TILE_ELEMS = 1 << 26
+
+
+def _knn_dists(points: np.ndarray, k: int) -> np.ndarray:
+    """(M, k) nearest-neighbor distances (self first) on the CPU: pykdtree if
+    installed, else scipy's cKDTree. Only reached for clouds too large for the
+    GPU path (or without CUDA); both return exact distances."""
+    try:
+        # Much faster build than cKDTree, OpenMP-parallel queries
+        from pykdtree.kdtree import KDTree
+    except ImportError:
+        from scipy.spatial import cKDTree
+
+        # Unbalanced/uncompacted tree builds ~2x faster on SfM point clouds
+        tree = cKDTree(points, balanced_tree=False, compact_nodes=False)
+        return tree.query(points, k=k, workers=-1)[0]
+    return KDTree(points).query(points, k=k)[0]
+
 
 def _compute_knn_scale(points: np.ndarray, k: int = 4) -> np.ndarray:
     """Compute initial Gaussian scale from k-nearest-neighbor distances."""
-    from scipy.spatial import cKDTree
-
-    tree = cKDTree(points)
-    dists, _ = tree.query(points, k=k + 1)  # +1 because closest is self
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    dists = _knn_dists(points, k + 1)  # +1 because closest is self
     avg_dist = dists[:, 1:].mean(axis=1)  # skip self
     return np.log(np.maximum(avg_dist, 1e-7)).astype(np.float32)
 
 
+def _compute_knn_scale_gpu(points: torch.Tensor, k: int = 4) -> torch.Tensor:
+    """GPU version of _compute_knn_scale for an on-device (M, 3) tensor: tiled
+    brute-force cdist + topk, so the means never round-trip through the host."""
+    n = points.shape[0]
+    out = torch.empty(n, device=points.device, dtype=torch.float32)
+    tile = max(1, KNN_GPU_TILE_ELEMS // n)
+    for i in range(0, n, tile):
+        # Direct differences, not cdist's |x|^2 + |y|^2 - 2xy matmul expansion
+        # (used above 25 rows), which in fp32 loses small neighbor spacings to
+        # cancellation against the coordinate magnitude
+        d = torch.cdist(
+            points[i : i + tile], points, compute_mode="donot_use_mm_for_euclid_dist"
+        )
+        vals, _ = d.topk(min(k + 1, n), dim=1, largest=False)  # +1: closest is self
+        out[i : i + tile] = vals[:, 1:].mean(dim=1)
+    return out.clamp_(min=1e-7).log_()
+
+
+def _activate(log_scales: torch.Tensor, logit_opacities: torch.Tensor):
+    """Rasterizer inputs from the optimized (log / logit) parameters."""
+    return torch.exp(log_scales), torch.sigmoid(logit_opacities)
+
+
+@functools.lru_cache
+def _ssim_window(device: str, size: int = 11, sigma: float = 1.5) -> torch.Tensor:
+    """Normalized 1D Gaussian SSIM window (size,), built once per device."""
+    dist = torch.arange(size, dtype=torch.float32, device=device) - (size - 1) / 2
+    gauss = torch.exp(-0.5 * (dist / sigma) ** 2)
+    return gauss / gauss.sum()
+
+
+def _ssim(x: torch.Tensor, y: torch.Tensor, window: torch.Tensor) -> torch.Tensor:
+    """Mean SSIM of (B, C, H, W) images in [0, 1].
+
+    Same result as torchmetrics' StructuralSimilarityIndexMeasure defaults
+    (11x11 Gaussian, sigma 1.5, border-cropped map), without the metric state.
+    The five local statistics are filtered together by one separable pair of
+    depthwise convs (2 x 11 taps per pixel instead of 121).
+    """
+    c1, c2 = 0.01**2, 0.03**2
+    channels = x.shape[1]
+    stats = torch.cat([x, y, x * x, y * y, x * y], dim=1)  # (B, 5C, H, W)
+    w = window.to(stats.dtype)
+    n = 5 * channels
+    stats = F.conv2d(stats, w.view(1, 1, 1, -1).expand(n, 1, 1, -1), groups=n)
+    stats = F.conv2d(stats, w.view(1, 1, -1, 1).expand(n, 1, -1, 1), groups=n)
+    mu_x, mu_y, e_xx, e_yy, e_xy = stats.split(channels, dim=1)
+    mu_xx, mu_yy, mu_xy = mu_x * mu_x, mu_y * mu_y, mu_x * mu_y
+    num = (2 * mu_xy + c1) * (2 * (e_xy - mu_xy) + c2)
+    den = (mu_xx + mu_yy + c1) * ((e_xx - mu_xx) + (e_yy - mu_yy) + c2)
+    return (num / den).mean()
+
+
+def _photometric_loss(
+    rendered: torch.Tensor,
+    gt_image: torch.Tensor,
+    ssim_window: torch.Tensor,
+    ssim_weight: float,
+    with_ssim: bool,
+) -> torch.Tensor:
+    """L1 (+ weighted D-SSIM when with_ssim) between (B, 3, H, W) images."""
+    l1_loss = F.l1_loss(rendered, gt_image)
+    if not with_ssim:
+        return l1_loss
+    ssim_loss = 1.0 - _ssim(rendered, gt_image, ssim_window)
+    return (1.0 - ssim_weight) * l1_loss + ssim_weight * ssim_loss
+
+
 def _se3_exp(tangent: torch.Tensor) -> torch.Tensor:
     """Map se(3) tangent vectors (N, 6) -> SE(3) transforms (N, 4, 4).
 
@@ -47,22 +137,43 @@ def _se3_exp(tangent: torch.Tensor) -> torch.Tensor:
     return torch.matrix_exp(gen)
 
 
-def _load_images_as_tensors(frame_paths: list[Path]) -> list[torch.Tensor]:
-    """Load images as (C, H, W) float32 CPU tensors.
+def _load_images_as_tensors(frame_paths: list[Path]) -> torch.Tensor:
+    """Load images into one (N, C, H, W) uint8 CPU tensor.
 
     Kept on the CPU (pinned for a fast async host->device copy when CUDA is
     available) so VRAM use is independent of the frame count: the training loop
     moves only the current step's batch to the GPU. Holding every frame resident
-    on the GPU was the main reason a high max_frames could OOM.
+    on the GPU was the main reason a high max_frames could OOM. Stored as uint8
+    (converted to float on the GPU) for 4x less pinned memory and H2D traffic;
+    decoded in parallel straight into the shared buffer.
     """
-    pin = torch.cuda.is_available()
-    tensors = []
-    for p in frame_paths:
-        img = iio.imread(str(p))  # (H, W, 3) uint8
-        t = torch.from_numpy(img).float() / 255.0  # (H, W, 3)
-        t = t.permute(2, 0, 1).contiguous()  # (C, H, W)
-        tensors.append(t.pin_memory() if pin else t)
-    return tensors
+    import cv2
+
+    def read_rgb(path: Path):
+        # OpenCV's decoders (libjpeg-turbo, SIMD libpng) beat imageio's and
+        # release the GIL, so the pool's threads really decode in parallel
+        img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError(f"Could not read training frame {path}")
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
+
+    first = read_rgb(frame_paths[0])  # (H, W, 3) uint8
+    h, w, c = first.shape
+    images = torch.empty(
+        (len(frame_paths), c, h, w), dtype=torch.uint8, pin_memory=torch.cuda.is_available()
+    )
+
+    def load(i: int):
+        img = first if i == 0 else read_rgb(frame_paths[i])
+        if img.shape != first.shape:
+            raise ValueError(
+                f"Training frame {frame_paths[i].name} is {img.shape}, expected {first.shape}"
+            )
+        images[i].copy_(torch.from_numpy(img).permute(2, 0, 1))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        list(ex.map(load, range(len(frame_paths))))
+    return images
 
 
 def train_gaussians(
@@ -103,26 +214,34 @@ def train_gaussians(
         optimize_poses = settings.pose_opt_enabled
     logger.info("Training gaussians: %d points, %d images, %d steps", n_points, n_images, max_steps)
 
-    with gpu_memory_guard():
+    # The job's tensors are freed by refcount when this returns (or raises), and
+    # the caching allocator reuses their blocks for the next job; forcing
+    # gc + empty_cache on every run only costs time and makes the next job
+    # re-grow its pool from the driver.
+    guard = gpu_memory_guard() if settings.aggressive_gpu_cleanup else nullcontext()
+    with guard:
         # Load training images (CPU/pinned; moved to GPU per-batch in the loop)
         images = _load_images_as_tensors(frame_paths)
-        img_h, img_w = images[0].shape[1], images[0].shape[2]
+        img_h, img_w = images.shape[2], images.shape[3]
 
         # Precompute camera data
-        # Convert cam-to-world to world-to-cam (viewmats)
+        # Convert cam-to-world to world-to-cam (viewmats). Poses are rigid, so
+        # the inverse is closed-form: [R | t]^-1 = [R^T | -R^T t].
         c2w = torch.from_numpy(poses).float().to(device)  # (N, 4, 4)
-        w2c = torch.linalg.inv(c2w)  # (N, 4, 4)
-
-        # Build proper intrinsics with principal point at image center
-        Ks = torch.from_numpy(intrinsics).float().to(device)  # (N, 3, 3)
-        for i in range(n_images):
-            if Ks[i, 0, 2] == 0:
-                Ks[i, 0, 2] = img_w / 2.0
-            if Ks[i, 1, 2] == 0:
-                Ks[i, 1, 2] = img_h / 2.0
-            # If fy is 0 (from DUSt3R), copy fx
-            if Ks[i, 1, 1] == 0:
-                Ks[i, 1, 1] = Ks[i, 0, 0]
+        rot_t = c2w[:, :3, :3].transpose(1, 2)
+        w2c = torch.zeros_like(c2w)  # (N, 4, 4), contiguous
+        w2c[:, :3, :3] = rot_t
+        w2c[:, :3, 3:] = -rot_t @ c2w[:, :3, 3:]
+        w2c[:, 3, 3] = 1.0
+
+        # Build proper intrinsics with principal point at image center. Patched
+        # on the CPU copy (vectorized) before a single upload.
+        Ks = torch.tensor(intrinsics, dtype=torch.float32)  # (N, 3, 3)
+        Ks[:, 0, 2].masked_fill_(Ks[:, 0, 2] == 0, img_w / 2.0)
+        Ks[:, 1, 2].masked_fill_(Ks[:, 1, 2] == 0, img_h / 2.0)
+        # If fy is 0 (from DUSt3R), copy fx
+        Ks[:, 1, 1] = torch.where(Ks[:, 1, 1] == 0, Ks[:, 0, 0], Ks[:, 1, 1])
+        Ks = Ks.to(device)
 
         # Initialize Gaussian parameters as a ParameterDict so gsplat's
         # DefaultStrategy can manage densification/pruning and migrate the
@@ -131,10 +250,11 @@ def train_gaussians(
         means_init = torch.from_numpy(points).float().to(device)
 
         # Scales from KNN distances (log space)
-        log_scales_np = _compute_knn_scale(points, k=settings.knn_k)
-        scales_init = (
-            torch.from_numpy(np.stack([log_scales_np] * 3, axis=-1)).float().to(device)
-        )
+        if means_init.is_cuda and n_points <= KNN_GPU_MAX_POINTS:
+            log_scales = _compute_knn_scale_gpu(means_init, k=settings.knn_k)
+        else:
+            log_scales = torch.from_numpy(_compute_knn_scale(points, k=settings.knn_k)).to(device)
+        scales_init = log_scales[:, None].repeat(1, 3)
 
         # Quaternions: identity rotation
         quats_init = torch.zeros(n_points, 4, device=device)
@@ -162,6 +282,15 @@ def train_gaussians(
 
         # One Adam per parameter — gsplat strategies require each optimizer to
         # hold a single param group so they can grow/prune its state in lockstep.
+        # With sparse_grad every gradient is COO over the visible Gaussians only
+        # (converted after backward where gsplat returns dense), which needs
+        # SparseAdam (same state layout).
+        # Dense Adam uses the fused CUDA kernel: one launch per step for each
+        # parameter instead of the foreach path's chain of elementwise kernels.
+        if settings.sparse_grad:
+            adam_cls, adam_kwargs = torch.optim.SparseAdam, {}
+        else:
+            adam_cls, adam_kwargs = torch.optim.Adam, {"fused": True}
         lrs = {
             "means": settings.lr_means,
             "scales": settings.lr_scales,
@@ -170,13 +299,13 @@ def train_gaussians(
             "sh": settings.lr_sh,
         }
         optimizers = {
-            name: torch.optim.Adam(
-                [{"params": params[name], "lr": lr, "name": name}], eps=1e-15
+            name: adam_cls(
+                [{"params": params[name], "lr": lr, "name": name}], eps=1e-15, **adam_kwargs
             )
             for name, lr in lrs.items()
         }
 
-        ssim_fn = StructuralSimilarityIndexMeasure(data_range=1.0).to(device)
+        ssim_window = _ssim_window(device)
 
         # Scale the densification (refine) window with training length.
         densify_end = max(settings.densify_end, int(max_steps * 0.7))
@@ -212,6 +341,7 @@ def train_gaussians(
                 refine_stop_iter=densify_end,
                 reset_every=settings.opacity_reset_interval,
                 refine_every=settings.densify_interval,
+                absgrad=settings.densify_absgrad,
                 verbose=True,
             )
             strategy_state = strategy.initialize_state(scene_scale=scene_scale)
@@ -222,8 +352,11 @@ def train_gaussians(
         lr_means_final = settings.lr_means_final
         if lr_means_final > 0 and lr_means_init > lr_means_final:
             lr_decay_rate = (lr_means_final / lr_means_init) ** (1.0 / max_steps)
+            means_scheduler = torch.optim.lr_scheduler.ExponentialLR(
+                optimizers["means"], gamma=lr_decay_rate
+            )
         else:
-            lr_decay_rate = 1.0
+            means_scheduler = None
 
         # Progressive SH activation schedule (step thresholds for each degree)
         sh_activation_steps = [0, 1000, 2000, 3000]
@@ -278,14 +411,70 @@ def train_gaussians(
             ppisp_schedulers = []
             logger.info("PPISP off: %s", exc)
 
+        # Camera batches (cameras_per_step views render in one rasterization
+        # call for better GPU utilization). Views are drawn from a reshuffled
+        # stack each epoch, as in reference 3DGS: cycling in frame order would
+        # batch near-identical adjacent frames. Their ground-truth frames are
+        # uploaded one step ahead on a side stream into a pair of device
+        # buffers, so the H2D copy overlaps the previous step's work.
+        batch = max(1, settings.cameras_per_step)
+        view_stack: list[int] = []
+        gt_buffers = [
+            torch.empty((batch, *images.shape[1:]), dtype=torch.uint8, device=device)
+            for _ in range(2)
+        ]
+        copy_stream = torch.cuda.Stream(device=device)
+
+        def prefetch(buf: torch.Tensor) -> list[int]:
+            """Draw the next camera batch and start uploading its frames."""
+            nonlocal view_stack
+            idxs = []
+            for _ in range(batch):
+                if not view_stack:
+                    view_stack = torch.randperm(n_images).tolist()
+                idxs.append(view_stack.pop())
+            # Don't overwrite buf before the main stream's earlier reads of it.
+            # Each images[i] is a view into the pinned buffer, so the copies are
+            # truly async.
+            copy_stream.wait_stream(torch.cuda.current_stream(device))
+            with torch.cuda.stream(copy_stream):
+                for j, i in enumerate(idxs):
+                    buf[j].copy_(images[i], non_blocking=True)
+            return idxs
+
+        next_idxs = prefetch(gt_buffers[0])
+
+        # bf16 keeps fp32's exponent range, so AMP needs no GradScaler (fp16
+        # without one can underflow small gradients); fp16 only on pre-Ampere.
+        amp_dtype = (
+            torch.bfloat16
+            if torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+            else torch.float16
+        )
+        # Under AMP the ground truth goes straight from uint8 to the autocast
+        # dtype (no fp32 copy): SSIM's convs consume it at half width, and ops
+        # autocast keeps in fp32 (e.g. l1_loss) upcast it themselves.
+        gt_dtype = amp_dtype if settings.use_amp else torch.float32
+
+        # Fuse the per-step activations (forward and backward) into fewer
+        # launches with Inductor when torch_compile is on (dynamic=True: the
+        # Gaussian count changes on every refine). gsplat has no raw log/logit
+        # input mode, so the activated tensors must still be materialized.
+        # Inductor doesn't handle sparse gradients, so sparse_grad runs eager.
+        if settings.torch_compile and not settings.sparse_grad:
+            activate = torch.compile(_activate, dynamic=True)
+        else:
+            activate = _activate
+        # The loss region sees a fixed image shape for the whole run, so it
+        # compiles static (one graph per with_ssim value, no shape guards).
+        photometric_loss = (
+            torch.compile(_photometric_loss, dynamic=False)
+            if settings.torch_compile
+            else _photometric_loss
+        )
+
         # Training loop
         for step in range(max_steps):
-            # Update means LR with exponential decay
-            if lr_decay_rate < 1.0:
-                optimizers["means"].param_groups[0]["lr"] = lr_means_init * (
-                    lr_decay_rate ** step
-                )
-
             pose_active = optimize_poses and step >= settings.pose_opt_start
             if pose_active and pose_lr_decay_rate < 1.0:
                 pose_opt.param_groups[0]["lr"] = pose_lr_init * (pose_lr_decay_rate ** step)
@@ -298,10 +487,12 @@ def train_gaussians(
             if pose_active:
                 pose_opt.zero_grad(set_to_none=True)
 
-            # Select this step's batch of cameras (cameras_per_step views render
-            # in one rasterization call for better GPU utilization).
-            batch = max(1, settings.cameras_per_step)
-            idxs = [(step * batch + j) % n_images for j in range(batch)]
+            # This step's (prefetched) camera batch; queue the next one's upload
+            idxs = next_idxs
+            torch.cuda.current_stream(device).wait_stream(copy_stream)
+            gt_image = gt_buffers[step % 2].to(gt_dtype).div_(255.0)  # (B, 3, H, W)
+            if step + 1 < max_steps:
+                next_idxs = prefetch(gt_buffers[(step + 1) % 2])
 
             # Progressive SH degree: activate higher bands as training progresses
             active_sh_degree = 0
@@ -312,23 +503,38 @@ def train_gaussians(
             # Build the batch's view matrices — quats are passed raw (the
             # rasterizer normalizes them). When pose optimization is active, apply
             # each camera's learned SE(3) delta (differentiable w.r.t. the delta).
-            if pose_active:
-                viewmats = _se3_exp(pose_deltas[idxs]) @ w2c[idxs]  # (B, 4, 4)
+            # A single camera is a narrow() view (no gather kernel); a batch
+            # uploads its indices once and shares them across the gathers.
+            if batch == 1:
+                cam_idx = None
+                viewmats = w2c.narrow(0, idxs[0], 1)  # (B, 4, 4)
+                Ks_b = Ks.narrow(0, idxs[0], 1)  # (B, 3, 3)
             else:
-                viewmats = w2c[idxs]  # (B, 4, 4)
-            Ks_b = Ks[idxs]  # (B, 3, 3)
+                cam_idx = torch.tensor(idxs, device=device)
+                viewmats = w2c.index_select(0, cam_idx)
+                Ks_b = Ks.index_select(0, cam_idx)
+            if pose_active:
+                deltas = (
+                    pose_deltas.narrow(0, idxs[0], 1)
+                    if cam_idx is None
+                    else pose_deltas.index_select(0, cam_idx)
+                )
+                viewmats = _se3_exp(deltas) @ viewmats
 
+            scales, opacities = activate(params["scales"], params["opacities"])
             renders, alphas, info = rasterization(
                 means=params["means"],
                 quats=params["quats"],
-                scales=torch.exp(params["scales"]),
-                opacities=torch.sigmoid(params["opacities"]),
+                scales=scales,
+                opacities=opacities,
                 colors=params["sh"],
                 viewmats=viewmats,
                 Ks=Ks_b,
                 width=img_w,
                 height=img_h,
-                packed=False,
+                packed=settings.sparse_grad,
+                sparse_grad=settings.sparse_grad,
+                absgrad=settings.densify_absgrad and not use_mcmc,
                 sh_degree=active_sh_degree,
                 rasterize_mode=settings.rasterize_mode,
             )
@@ -352,30 +558,39 @@ def train_gaussians(
                     )
                 rendered_views.append(r.permute(2, 0, 1))  # (3, H, W)
             rendered = torch.stack(rendered_views, dim=0)  # (B, 3, H, W)
-            # Move only this step's batch to the GPU (non_blocking pairs with the
-            # pinned CPU tensors above for an async copy).
-            gt_image = torch.stack([images[i] for i in idxs], dim=0).to(
-                device, non_blocking=True
-            )  # (B, 3, H, W)
-
-            # L1 every step; SSIM (more expensive) only every ssim_every steps.
+            # L1 every step; SSIM (more expensive) only every ssim_every steps,
+            # starting at ssim_start_step.
             # Loss math optionally under autocast (rasterizer stays fp32).
-            with torch.autocast(device_type="cuda", enabled=settings.use_amp):
-                l1_loss = F.l1_loss(rendered, gt_image)
-                if settings.ssim_every <= 1 or step % settings.ssim_every == 0:
-                    ssim_loss = 1.0 - ssim_fn(rendered, gt_image)
-                    loss = (
-                        (1.0 - settings.ssim_weight) * l1_loss
-                        + settings.ssim_weight * ssim_loss
-                    )
-                else:
-                    loss = l1_loss
+            with torch.autocast(device_type="cuda", dtype=amp_dtype, enabled=settings.use_amp):
+                loss = photometric_loss(
+                    rendered,
+                    gt_image,
+                    ssim_window,
+                    settings.ssim_weight,
+                    step >= settings.ssim_start_step
+                    and (settings.ssim_every <= 1 or step % settings.ssim_every == 0),
+                )
                 if use_ppisp:
                     loss = loss + settings.ppisp_reg_weight * ppisp_module.get_regularization_loss()
             loss = loss.float()
 
             loss.backward()
 
+            if settings.sparse_grad:
+                # The packed rasterizer only emits sparse grads for some params;
+                # the ones gsplat gathers by index (means, opacities, sh) come
+                # back dense, which SparseAdam rejects. Re-express those over
+                # the visible rows (unique: a batch repeats shared Gaussians).
+                ids = info["gaussian_ids"]
+                if batch > 1:
+                    ids = torch.unique(ids)
+                for p in params.values():
+                    if p.grad is None or p.grad.is_sparse:
+                        continue
+                    p.grad = torch.sparse_coo_tensor(
+                        ids[None], p.grad[ids], size=p.shape, is_coalesced=True
+                    )
+
             for opt in optimizers.values():
                 opt.step()
             if use_ppisp:
@@ -401,9 +616,14 @@ def train_gaussians(
                 # gsplat crashes. Skip this step's refine; accumulation resumes next
                 # step. (Reset itself happens at step 3000, before grads go None.)
                 strategy.step_post_backward(
-                    params, optimizers, strategy_state, step, info, packed=False
+                    params, optimizers, strategy_state, step, info,
+                    packed=settings.sparse_grad,
                 )
 
+            # Decay the means LR (after the MCMC refine, which reads this step's LR)
+            if means_scheduler is not None:
+                means_scheduler.step()
+
             # Log SH degree activation
             if active_sh_degree > 0 and step in sh_activation_steps:
                 logger.info("Activated SH degree %d at step %d", active_sh_degree, step)
@@ -490,7 +710,7 @@ def _save_preview(
     with torch.no_grad():
         renders, _, _ = rasterization(
             means=means,
-            quats=quats / (quats.norm(dim=-1, keepdim=True) + 1e-8),
+            quats=quats,  # raw, normalized in the rasterizer (as in training)
             scales=scales,
             opacities=opacities,
             colors=sh_coeffs,
@@ -572,32 +792,24 @@ def export_ply(
     ]
     header = "\n".join(header_lines)
 
-    # Build data array: x,y,z (3) + f_dc (3) + f_rest (n_rest*3) + opacity (1) + scale (3) + rot (4)
-    n_floats = 3 + 3 + n_rest * 3 + 1 + 3 + 4
-    data = np.empty((n, n_floats), dtype=np.float32)
-
-    col = 0
-    # Position
-    data[:, col:col+3] = means.astype(np.float32)
-    col += 3
-    # DC coefficients: sh_coeffs[:, 0, :] -> (N, 3)
-    data[:, col:col+3] = sh_coeffs[:, 0, :].astype(np.float32)
-    col += 3
-    # Higher-order SH: sh_coeffs[:, 1:, :] -> (N, n_rest, 3) -> flatten to (N, n_rest*3)
-    # Standard 3DGS PLY ordering: interleave as [sh1_r, sh1_g, sh1_b, sh2_r, ...]
+    # One record per vertex: x,y,z (3) + f_dc (3) + f_rest (n_rest*3) + opacity (1)
+    # + scale (3) + rot (4). Each input is copied (and cast, if not float32)
+    # straight into its field. f_rest is an (n_rest, 3) subarray, so
+    # sh_coeffs[:, 1:, :] lands interleaved as [sh1_r, sh1_g, sh1_b, sh2_r, ...]
+    # without a reshape copy.
+    fields = [("xyz", "<f4", 3), ("f_dc", "<f4", 3)]
+    if n_rest > 0:
+        fields.append(("f_rest", "<f4", (n_rest, 3)))
+    fields += [("opacity", "<f4"), ("scale", "<f4", 3), ("rot", "<f4", 4)]
+    data = np.empty(n, dtype=fields)
+    data["xyz"] = means
+    data["f_dc"] = sh_coeffs[:, 0, :]
     if n_rest > 0:
-        rest = sh_coeffs[:, 1:, :].reshape(n, n_rest * 3).astype(np.float32)
-        data[:, col:col+n_rest*3] = rest
-        col += n_rest * 3
-    # Opacity
-    data[:, col] = logit_opacities.astype(np.float32)
-    col += 1
-    # Scales
-    data[:, col:col+3] = log_scales.astype(np.float32)
-    col += 3
-    # Rotations
-    data[:, col:col+4] = quats.astype(np.float32)
+        data["f_rest"] = sh_coeffs[:, 1:, :]
+    data["opacity"] = logit_opacities
+    data["scale"] = log_scales
+    data["rot"] = quats
 
     with open(path, "wb") as f:
         f.write(header.encode("ascii"))
-        f.write(data.tobytes())
+        data.tofile(f)  # no intermediate bytes copy
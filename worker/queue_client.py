@@ -17,18 +17,29 @@ from worker.models import JobConfig, OutputFormat
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streamed video downloads and result uploads
+TRANSFER_CHUNK_BYTES = 1 << 20
+
+
+async def _read_chunks(path: Path):
+    """Yield a file's bytes in TRANSFER_CHUNK_BYTES pieces (an upload body)."""
+    with open(path, "rb") as f:
+        while chunk := f.read(TRANSFER_CHUNK_BYTES):
+            yield chunk
+
 
 class QueueClient:
     def __init__(self):
         self.base_url = settings.queue_url.rstrip("/")
         self.headers = {"Authorization": f"Bearer {settings.queue_api_key}"}
         self.poll_interval = settings.queue_poll_interval
+        self._client: httpx.AsyncClient | None = None
 
     async def run(self, process_job_fn, gpu_lock=None):
         """Main polling loop. Runs forever as a background task.
 
-        gpu_lock: the worker's GPU lock. While it's held — i.e. a job (a direct
-        upload or another queue job) is running the splat pipeline — we skip
+        gpu_lock: the worker's GPU lock/semaphore. While it's fully held — i.e.
+        jobs (direct uploads or other queue jobs) occupy every GPU slot — we skip
         claiming so we don't mark a queue job "processing" and download its video
         only to block on the GPU. Claims resume once the GPU is free.
         """
@@ -38,42 +49,45 @@ class QueueClient:
             self.poll_interval,
         )
 
-        busy_logged = False
-        while True:
-            try:
-                if gpu_lock is not None and gpu_lock.locked():
-                    if not busy_logged:
-                        logger.info("GPU busy with current job — pausing queue claims")
-                        busy_logged = True
-                    await asyncio.sleep(self.poll_interval)
-                    continue
-                if busy_logged:
-                    logger.info("GPU free — resuming queue claims")
-                    busy_logged = False
-
-                claimed = await self._claim_job()
-                if claimed:
-                    job_id = claimed["id"]
-                    config = claimed["config"]
-                    logger.info("Claimed job %s from queue", job_id)
-                    await self._process_remote_job(job_id, config, process_job_fn)
-                else:
+        # One pooled client for every call: keepalive connections (and HTTP/2
+        # multiplexing) instead of a TCP+TLS handshake per poll and status update.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            timeout=httpx.Timeout(10.0, read=120.0),
+        )
+        async with self._client:
+            busy_logged = False
+            while True:
+                try:
+                    if gpu_lock is not None and gpu_lock.locked():
+                        if not busy_logged:
+                            logger.info("GPU busy with current job — pausing queue claims")
+                            busy_logged = True
+                        await asyncio.sleep(self.poll_interval)
+                        continue
+                    if busy_logged:
+                        logger.info("GPU free — resuming queue claims")
+                        busy_logged = False
+
+                    claimed = await self._claim_job()
+                    if claimed:
+                        job_id = claimed["id"]
+                        config = claimed["config"]
+                        logger.info("Claimed job %s from queue", job_id)
+                        await self._process_remote_job(job_id, config, process_job_fn)
+                    else:
+                        await asyncio.sleep(self.poll_interval)
+                except Exception:
+                    logger.exception("Queue poll error")
                     await asyncio.sleep(self.poll_interval)
-            except Exception:
-                logger.exception("Queue poll error")
-                await asyncio.sleep(self.poll_interval)
 
     async def _claim_job(self) -> dict | None:
         """Try to claim the oldest queued job."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.base_url}/api/v1/worker/claim",
-                headers=self.headers,
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("job")
+        resp = await self._client.post("/api/v1/worker/claim", timeout=10)
+        resp.raise_for_status()
+        return resp.json().get("job")
 
     async def _process_remote_job(self, job_id: str, config: dict, process_job_fn):
         """Download video, run pipeline, upload result."""
@@ -129,15 +143,14 @@ class QueueClient:
     async def _download_video(self, job_id: str, job_dir: Path) -> Path:
         """Download video from the Worker's R2 storage."""
         video_path = job_dir / "input.mp4"
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/api/v1/worker/jobs/{job_id}/video",
-                headers=self.headers,
-                timeout=120,
-            )
+        # Streamed to disk in chunks: memory stays flat regardless of video size
+        async with self._client.stream(
+            "GET", f"/api/v1/worker/jobs/{job_id}/video", timeout=120
+        ) as resp:
             resp.raise_for_status()
             with open(video_path, "wb") as f:
-                f.write(resp.content)
+                async for chunk in resp.aiter_bytes(TRANSFER_CHUNK_BYTES):
+                    f.write(chunk)
 
         logger.info("Downloaded video for job %s (%.1f MB)", job_id, video_path.stat().st_size / 1e6)
         return video_path
@@ -153,14 +166,10 @@ class QueueClient:
             body["error"] = error
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.put(
-                    f"{self.base_url}/api/v1/worker/jobs/{job_id}/status",
-                    headers=self.headers,
-                    json=body,
-                    timeout=10,
-                )
-                resp.raise_for_status()
+            resp = await self._client.put(
+                f"/api/v1/worker/jobs/{job_id}/status", json=body, timeout=10
+            )
+            resp.raise_for_status()
         except Exception:
             logger.warning("Failed to update status for job %s", job_id, exc_info=True)
 
@@ -171,15 +180,13 @@ class QueueClient:
             if not preview_path.exists():
                 continue
             try:
-                async with httpx.AsyncClient() as client:
-                    with open(preview_path, "rb") as f:
-                        resp = await client.put(
-                            f"{self.base_url}/api/v1/worker/jobs/{job_id}/preview?format={ext}",
-                            headers=self.headers,
-                            content=f.read(),
-                            timeout=60,
-                        )
-                        resp.raise_for_status()
+                with open(preview_path, "rb") as f:
+                    resp = await self._client.put(
+                        f"/api/v1/worker/jobs/{job_id}/preview?format={ext}",
+                        content=f.read(),
+                        timeout=60,
+                    )
+                resp.raise_for_status()
                 logger.info("Uploaded %s preview for job %s", ext, job_id)
             except Exception:
                 logger.warning(
@@ -188,12 +195,13 @@ class QueueClient:
 
     async def _upload_result(self, job_id: str, result_path: Path):
         """Upload the .splat/.ply result to the Worker's R2 storage."""
-        async with httpx.AsyncClient() as client:
-            with open(result_path, "rb") as f:
-                resp = await client.put(
-                    f"{self.base_url}/api/v1/worker/jobs/{job_id}/result",
-                    headers=self.headers,
-                    content=f.read(),
-                    timeout=120,
-                )
-                resp.raise_for_status()
+        # Streamed from disk rather than read whole (PLY exports run to GBs).
+        # Content-Length is sent explicitly so the body isn't chunk-encoded:
+        # the Worker streams it straight into R2, which needs a known length.
+        resp = await self._client.put(
+            f"/api/v1/worker/jobs/{job_id}/result",
+            content=_read_chunks(result_path),
+            headers={"Content-Length": str(result_path.stat().st_size)},
+            timeout=120,
+        )
+        resp.raise_for_status()
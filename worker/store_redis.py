@@ -0,0 +1,141 @@
+"""
+Redis-backed job store (optional — set SPLAT_REDIS_URL to enable).
+
+Persists direct-upload job records so status survives a worker restart and
+can be served by any replica sharing the same Redis and jobs_dir. The
+in-process `jobs` dict in app.py stays the working copy; this is the durable,
+shared copy plus the FIFO that feeds the pipeline.
+
+Data model:
+  job:{id}       HASH  job record (JSON-encoded fields), expires after job_ttl_hours
+  queue:jobs     LIST  queued job IDs — LPUSH in, BLMOVE out (FIFO)
+  queue:running  LIST  claimed job IDs. BLMOVE claims atomically, so a job held
+                       by a worker that crashed is never lost: the reclaimer
+                       requeues it once it goes redis_visibility_timeout_s
+                       without an update (at-least-once processing).
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import time
+from datetime import datetime
+
+import redis.asyncio as redis
+
+from worker.config import settings
+from worker.models import JobConfig, JobStatus, Stage
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY = "job:{}"
+QUEUE_KEY = "queue:jobs"
+RUNNING_KEY = "queue:running"
+
+
+def _encode(job: dict) -> dict[str, str]:
+    return {
+        "status": job["status"].value,
+        "created_at": job["created_at"].isoformat(),
+        "created_at_ts": str(job["created_at_ts"]),
+        "updated_at_ts": str(time.time()),
+        "config": job["config"].model_dump_json(),
+        "video_path": job["video_path"],
+        "job_dir": job["job_dir"],
+        "stages": json.dumps([dataclasses.asdict(s) for s in job["stages"].values()]),
+        "error": job["error"] or "",
+        "result_path": job["result_path"] or "",
+    }
+
+
+def _decode(fields: dict[str, str]) -> dict:
+    return {
+        "status": JobStatus(fields["status"]),
+        "created_at": datetime.fromisoformat(fields["created_at"]),
+        "created_at_ts": float(fields["created_at_ts"]),
+        "config": JobConfig.model_validate_json(fields["config"]),
+        "video_path": fields["video_path"],
+        "job_dir": fields["job_dir"],
+        "stages": {s["name"]: Stage(**s) for s in json.loads(fields["stages"])},
+        "error": fields["error"] or None,
+        "result_path": fields["result_path"] or None,
+    }
+
+
+class RedisJobStore:
+    def __init__(self):
+        self.redis = redis.from_url(settings.redis_url, decode_responses=True)
+        self.ttl_seconds = settings.job_ttl_hours * 3600
+
+    async def save(self, job_id: str, job: dict):
+        """Write the job record (and refresh its update time and TTL). A job
+        deleted meanwhile (possibly via another replica) stays deleted."""
+        key = JOB_KEY.format(job_id)
+        if not await self.redis.exists(key):
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=_encode(job))
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def touch(self, job_id: str):
+        """Heartbeat a claimed job: refresh its update time (and TTL) so the
+        reclaimer doesn't requeue it, without rewriting the record."""
+        key = JOB_KEY.format(job_id)
+        if not await self.redis.exists(key):
+            return  # deleted; don't recreate a partial record
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, "updated_at_ts", str(time.time()))
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def load(self, job_id: str) -> dict | None:
+        fields = await self.redis.hgetall(JOB_KEY.format(job_id))
+        return _decode(fields) if fields else None
+
+    async def delete(self, job_id: str):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(JOB_KEY.format(job_id))
+            pipe.lrem(QUEUE_KEY, 0, job_id)
+            pipe.lrem(RUNNING_KEY, 0, job_id)
+            await pipe.execute()
+
+    async def enqueue(self, job_id: str, job: dict):
+        """Persist a new job and append it to the queue, atomically."""
+        key = JOB_KEY.format(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=_encode(job))
+            pipe.expire(key, self.ttl_seconds)
+            pipe.lpush(QUEUE_KEY, job_id)
+            await pipe.execute()
+
+    async def claim(self) -> str:
+        """Block until a job is queued, moving it to the running list."""
+        return await self.redis.blmove(QUEUE_KEY, RUNNING_KEY, 0, "RIGHT", "LEFT")
+
+    async def ack(self, job_id: str):
+        """Mark a claimed job finished (completed or failed)."""
+        await self.redis.lrem(RUNNING_KEY, 0, job_id)
+
+    async def reclaim_stale(self):
+        """Background task: requeue running jobs whose record hasn't been
+        updated within the visibility timeout (their worker likely died)."""
+        while True:
+            await asyncio.sleep(settings.redis_reclaim_interval_s)
+            try:
+                now = time.time()
+                for job_id in await self.redis.lrange(RUNNING_KEY, 0, -1):
+                    updated = await self.redis.hget(JOB_KEY.format(job_id), "updated_at_ts")
+                    if updated is None:
+                        # Record expired or deleted — nothing left to run
+                        await self.redis.lrem(RUNNING_KEY, 0, job_id)
+                        continue
+                    if now - float(updated) < settings.redis_visibility_timeout_s:
+                        continue
+                    # Only the replica whose LREM actually removed it requeues it
+                    if await self.redis.lrem(RUNNING_KEY, 1, job_id):
+                        await self.redis.lpush(QUEUE_KEY, job_id)
+                        logger.warning("Requeued stale job %s", job_id)
+            except Exception:
+                logger.exception("Redis reclaim error")
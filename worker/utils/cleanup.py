@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import logging
 import shutil
 import time
@@ -8,6 +9,15 @@ from worker.config import settings
 
 logger = logging.getLogger(__name__)
 
+# (expiry_ts, job_id) min-heap over the jobs registered with schedule_expiry,
+# so each cleanup pass touches only the jobs that have actually expired
+_expiry_heap: list[tuple[float, str]] = []
+
+
+def schedule_expiry(job_id: str, created_at_ts: float):
+    """Register a job for removal job_ttl_hours after its creation time."""
+    heapq.heappush(_expiry_heap, (created_at_ts + settings.job_ttl_hours * 3600, job_id))
+
 
 def cleanup_job_dir(job_dir: Path, keep_result: bool = True):
     """Remove intermediate files from a job directory, optionally keeping the result."""
@@ -33,23 +43,27 @@ def remove_job_dir(job_dir: Path):
 
 async def periodic_cleanup(jobs: dict):
     """Background task to remove expired jobs."""
-    ttl_seconds = settings.job_ttl_hours * 3600
     interval_seconds = settings.cleanup_interval_minutes * 60
 
     while True:
         await asyncio.sleep(interval_seconds)
         now = time.time()
         expired = []
-        for job_id, job in jobs.items():
-            created = job.get("created_at_ts", 0)
-            if now - created > ttl_seconds:
+        while _expiry_heap and _expiry_heap[0][0] < now:
+            _, job_id = heapq.heappop(_expiry_heap)
+            # Already deleted, or a duplicate entry from a re-registered job
+            if job_id in jobs:
                 expired.append(job_id)
 
+        # rmtree of a job's frames can take seconds: delete on worker threads
+        # (in parallel across jobs) so the event loop keeps serving requests.
+        dirs = []
         for job_id in expired:
             job = jobs.pop(job_id, None)
             if job and "job_dir" in job:
-                remove_job_dir(Path(job["job_dir"]))
+                dirs.append(Path(job["job_dir"]))
             logger.info("Expired job removed: %s", job_id)
+        await asyncio.gather(*(asyncio.to_thread(remove_job_dir, d) for d in dirs))
 
         if expired:
             logger.info("Periodic cleanup: removed %d expired jobs", len(expired))
@@ -1,11 +1,40 @@
 import logging
+import os
 from contextlib import contextmanager
 
+# Densification regrows/prunes every Gaussian tensor (and its Adam moments) on
+# each refine step; expandable segments let the caching allocator extend blocks
+# in place instead of fragmenting VRAM with ever-larger fresh allocations. Read
+# when CUDA initializes, so set before torch touches the device.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 import torch
 
+from worker.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+def gpu_job_slots() -> int:
+    """Number of jobs allowed on the GPU at once (see max_gpu_memory_fraction)."""
+    return max(1, int(1 / settings.max_gpu_memory_fraction))
+
+
+def limit_gpu_memory():
+    """Cap this process's CUDA caching allocator at slots * per-job fraction.
+
+    The cap is process-wide (concurrent jobs share one allocator), so this
+    bounds the combined footprint of all GPU slots rather than each job; it
+    turns an over-budget job into an OOM error instead of starving other
+    processes on the device.
+    """
+    if not torch.cuda.is_available():
+        return
+    fraction = min(1.0, gpu_job_slots() * settings.max_gpu_memory_fraction)
+    torch.cuda.set_per_process_memory_fraction(fraction, torch.device(settings.gpu_device))
+    logger.info("GPU memory capped at %.0f%% (%d job slot(s))", fraction * 100, gpu_job_slots())
+
+
 def get_gpu_memory_info() -> dict:
     """Return GPU memory stats in MB."""
     if not torch.cuda.is_available():